@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import ContactMessage, JobApplication, Post, JobOpening, Service
+from django.utils import timezone
+from .models import ContactMessage, JobApplication, Post, JobOpening, Service, OutboundEmail
 
 
 @admin.register(ContactMessage)
@@ -30,3 +31,16 @@ class ServiceAdmin(admin.ModelAdmin):
     list_display = ('title', 'icon', 'order', 'is_active')
     list_filter = ('is_active',)
     search_fields = ('title', 'tagline', 'description')
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
+    actions = ['retry_now']
+
+    @admin.action(description="Retry selected emails now")
+    def retry_now(self, request, queryset):
+        queryset.exclude(status=OutboundEmail.STATUS_SENT).update(
+            status=OutboundEmail.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now(),
+        )
@@ -0,0 +1,74 @@
+"""
+Response cache for the public read endpoints.
+
+Every cached model has a version counter that lives in the cache itself.
+Saving or deleting a row bumps the counter (see ``api/signals.py``), which
+changes every key built from it, so stale entries are never read again and
+simply age out of the backend.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+
+def get_cache():
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def _version_key(model):
+    return f'api:version:{model._meta.label_lower}'
+
+
+def get_version(model):
+    """Current version counter for ``model``, seeding it if missing."""
+    cache = get_cache()
+    key = _version_key(model)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock instead of 1: a counter that was evicted must
+        # never come back to a value that older entries were stored under.
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(model):
+    """Invalidate every cached response that includes rows of ``model``."""
+    cache = get_cache()
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def versioned_key(models, *parts):
+    """Cache key that changes whenever any of ``models`` is modified."""
+    versions = '.'.join(str(get_version(model)) for model in models)
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'api:{versions}:{digest}'
+
+
+class CachedListMixin:
+    """Serve GET list responses from the response cache.
+
+    ``cache_models`` names every model whose rows appear in the response.
+    The key is built from their current versions and the absolute request
+    URL (serialized image URLs depend on the host).
+    """
+    cache_models = ()
+
+    def get_cache_key(self, request):
+        return versioned_key(self.cache_models, 'response', request.build_absolute_uri())
+
+    def list(self, request, *args, **kwargs):
+        cache = get_cache()
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, getattr(settings, 'API_CACHE_TIMEOUT', 300))
+        return Response(data)
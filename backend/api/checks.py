@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Warning, register
+
+
+@register('caches')
+def check_shared_cache(app_configs, **kwargs):
+    """The response cache must be shared once there is more than one process."""
+    if settings.DEBUG:
+        return []
+    alias = getattr(settings, 'API_CACHE_ALIAS', 'default')
+    if not isinstance(caches[alias], LocMemCache):
+        return []
+    return [Warning(
+        f"The '{alias}' cache is per-process (locmem) with DEBUG off.",
+        hint=(
+            "Set CACHE_URL to redis://... or file:///... so that admin edits, management commands "
+            "and every gunicorn worker see the same cache versions."
+        ),
+        id='api.W001',
+    )]
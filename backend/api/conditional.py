@@ -0,0 +1,76 @@
+"""
+Conditional GET support (ETag / Last-Modified / 304) for the public views.
+
+The validators come from a single aggregate over ``updated_at``, so a
+revalidation that matches is answered without loading or serializing a row.
+
+Lists only get an ETag: deleting or unpublishing a row that is not the most
+recently updated one leaves ``Max(updated_at)`` where it was, so
+``If-Modified-Since`` would answer 304 with a stale list. The ETag also
+covers the row count and catches that.
+"""
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from .cache import get_cache, versioned_key
+
+
+class ConditionalGetMixin:
+    """Answer ``If-None-Match`` / ``If-Modified-Since`` before doing any work.
+
+    Views that also set ``cache_models`` keep the aggregate in the response
+    cache, so a revalidation costs no query until the content changes.
+    """
+
+    def _lookup_value(self):
+        return self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+
+    def get_validator_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self._lookup_value() is not None:
+            queryset = queryset.filter(**{self.lookup_field: self._lookup_value()})
+        return queryset
+
+    def get_validator_state(self):
+        """Return ``(row_count, last_updated_at)`` for this response."""
+        state = self.get_validator_queryset().aggregate(count=Count('pk'), last=Max('updated_at'))
+        return state['count'], state['last']
+
+    def get_validators(self, request):
+        cache_models = getattr(self, 'cache_models', ())
+        if cache_models:
+            cache = get_cache()
+            key = versioned_key(cache_models, 'validators', request.get_full_path())
+            state = cache.get(key)
+            if state is None:
+                state = self.get_validator_state()
+                cache.set(key, state, getattr(settings, 'API_CACHE_TIMEOUT', 300))
+        else:
+            state = self.get_validator_state()
+        count, last = state
+        is_detail = self._lookup_value() is not None
+        if not count and is_detail:
+            return None, None  # let the view answer 404
+        # The accepted media type is part of the ETag: the browsable API and
+        # JSON share a URL but not a representation.
+        raw = f'{request.path}:{request.accepted_media_type}:{count}:{last.isoformat() if last else ""}'
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        last_modified = int(last.timestamp()) if last and is_detail else None
+        return etag, last_modified
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        if etag is not None:
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is not None:
+                return response
+        response = super().get(request, *args, **kwargs)
+        if etag is not None and response.status_code == 200:
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
@@ -0,0 +1,80 @@
+"""
+Query-string filters for the admin application and contact lists.
+
+All filtering happens in SQL and is backed by the indexes on
+``JobApplication`` / ``ContactMessage``:
+
+* ``created_after`` / ``created_before``: ISO date or datetime. A bare date
+  covers the whole day, so ``created_before=2026-03-31`` includes March 31.
+* ``job_title``: exact position title (applications only).
+* ``experience_min`` / ``experience_max``: whole years, inclusive
+  (applications only).
+"""
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+def _parse_bound(params, name):
+    """Return ``(aware datetime, is_bare_date)``, or ``(None, False)`` if absent."""
+    value = params.get(name)
+    if not value:
+        return None, False
+    try:
+        # Dates first: parse_datetime() also accepts a bare date, as midnight.
+        day = parse_date(value)
+        if day is not None:
+            parsed, is_date = datetime.combine(day, time.min), True
+        else:
+            parsed, is_date = parse_datetime(value), False
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: 'Enter a date (YYYY-MM-DD) or an ISO 8601 datetime.'})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed, is_date
+
+
+def _parse_int(params, name):
+    value = params.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValidationError({name: 'Enter a whole number.'})
+    if number < 0:
+        raise ValidationError({name: 'Must be zero or more.'})
+    return number
+
+
+def filter_created(queryset, params):
+    """Apply the ``created_after`` / ``created_before`` range."""
+    after, _ = _parse_bound(params, 'created_after')
+    if after is not None:
+        queryset = queryset.filter(created_at__gte=after)
+    before, whole_day = _parse_bound(params, 'created_before')
+    if before is not None:
+        if whole_day:
+            queryset = queryset.filter(created_at__lt=before + timedelta(days=1))
+        else:
+            queryset = queryset.filter(created_at__lte=before)
+    return queryset
+
+
+def filter_applications(queryset, params):
+    """Apply every application filter present in ``params``."""
+    queryset = filter_created(queryset, params)
+    job_title = params.get('job_title')
+    if job_title:
+        queryset = queryset.filter(job_title=job_title)
+    experience_min = _parse_int(params, 'experience_min')
+    if experience_min is not None:
+        queryset = queryset.filter(experience_years__gte=experience_min)
+    experience_max = _parse_int(params, 'experience_max')
+    if experience_max is not None:
+        queryset = queryset.filter(experience_years__lte=experience_max)
+    return queryset
@@ -0,0 +1,120 @@
+"""
+Resized WebP/JPEG variants of ``Post.image``.
+
+Variants are stored next to the original as
+``<dir>/variants/<stem>-<width>w.<ext>``. They are generated when an admin
+uploads an image, by ``manage.py generate_image_variants`` for images that
+predate this pipeline, and lazily on the first request of a missing file.
+Images are never upscaled, so only the configured widths below the
+original's are written, plus the next one up, which holds the original size.
+``Post.image_width`` records that size.
+
+``image_srcsets`` gives the serializer a ``srcset`` string per format,
+labelled with the real pixel widths. Every URL carries a ``v`` token derived
+from the image name; uploads always get a fresh name, so the variant URLs can
+be cached forever.
+"""
+import hashlib
+import io
+import posixpath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.urls import reverse
+from PIL import Image, ImageOps
+
+FORMATS = {
+    # url suffix: (Pillow format, content type, save options)
+    'webp': ('WEBP', 'image/webp', {'quality': 80, 'method': 4}),
+    'jpg': ('JPEG', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def get_widths():
+    return tuple(getattr(settings, 'IMAGE_VARIANT_WIDTHS', (320, 640, 1024, 1600)))
+
+
+def version_token(name):
+    return hashlib.md5(name.encode()).hexdigest()[:10]
+
+
+def variant_widths(original_width):
+    """``[(configured width, actual pixel width)]`` for an image ``original_width`` px wide."""
+    pairs = []
+    for width in get_widths():
+        pairs.append((width, min(width, original_width)))
+        if width >= original_width:
+            break
+    return pairs
+
+
+def variant_name(name, width, fmt):
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, 'variants', f'{stem}-{width}w.{fmt}')
+
+
+def _encode(image, width, fmt):
+    pil_format, _, options = FORMATS[fmt]
+    resized = image.copy()
+    resized.thumbnail((width, width * 10), Image.LANCZOS)  # never upscales
+    if pil_format == 'JPEG' and resized.mode != 'RGB':
+        if resized.mode in ('RGBA', 'LA', 'P'):
+            resized = resized.convert('RGBA')
+            background = Image.new('RGB', resized.size, (255, 255, 255))
+            background.paste(resized, mask=resized.getchannel('A'))
+            resized = background
+        else:
+            resized = resized.convert('RGB')
+    buffer = io.BytesIO()
+    resized.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def generate_variants(field_file, only_missing=True, original_width=None):
+    """Write the variants of ``field_file`` and return the original's width in pixels.
+
+    With ``only_missing`` and a known ``original_width`` nothing is decoded
+    when every variant exists. Otherwise the original is decoded once and
+    each variant is resized from it.
+    """
+    storage, name = field_file.storage, field_file.name
+    if only_missing and original_width and all(
+        storage.exists(variant_name(name, width, fmt))
+        for width, _ in variant_widths(original_width) for fmt in FORMATS
+    ):
+        return original_width
+    with storage.open(name, 'rb') as f:
+        image = Image.open(f)
+        image = ImageOps.exif_transpose(image)  # also loads the pixels
+    if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode == 'P' else 'RGB')
+    for width, _ in variant_widths(image.width):
+        for fmt in FORMATS:
+            target = variant_name(name, width, fmt)
+            if storage.exists(target):
+                if only_missing:
+                    continue
+                storage.delete(target)
+            storage.save(target, ContentFile(_encode(image, width, fmt)))
+    return image.width
+
+
+def image_srcsets(post, request=None):
+    """``{'webp': 'url 320w, url 640w, ...', 'jpg': ...}`` for ``post.image``, or None.
+
+    None too while ``post.image_width`` is unknown: a srcset must not claim
+    widths the image does not have.
+    """
+    if not post.image or not post.image_width:
+        return None
+    token = version_token(post.image.name)
+    srcsets = {}
+    for fmt in FORMATS:
+        entries = []
+        for width, actual in variant_widths(post.image_width):
+            url = reverse('api-post-image-variant', kwargs={'pk': post.pk, 'width': width, 'fmt': fmt})
+            url = f'{url}?v={token}'
+            entries.append(f'{request.build_absolute_uri(url) if request else url} {actual}w')
+        srcsets[fmt] = ', '.join(entries)
+    return srcsets
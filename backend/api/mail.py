@@ -0,0 +1,132 @@
+"""
+Email outbox.
+
+Request handlers only call :func:`queue_email`, which stores a row and
+returns at once. ``manage.py send_outbox`` drains due rows in batches over a
+single SMTP connection, retrying failures with exponential backoff and
+dead-lettering a message once it runs out of attempts.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboundEmail
+from .timing import span
+
+
+def queue_email(subject, html_body, attachments=None):
+    """Store an email for all configured receivers in the outbox.
+
+    ``attachments`` is a list of ``{'filename', 'path', 'type', 'url'}`` dicts
+    where ``path`` is a name in the default storage; the file is read at send
+    time. ``url`` is optional: a link to the same file, sent in the body
+    instead when the worker cannot read ``path`` (e.g. it runs on another
+    machine than the web process that stored the upload).
+    """
+    recipients = getattr(settings, 'EMAIL_RECEIVERS', [])
+    if not recipients:
+        print("[Email] No EMAIL_RECEIVERS configured in .env")
+        return None
+
+    with span('mail'):
+        return OutboundEmail.objects.create(
+            subject=subject,
+            html_body=html_body,
+            to=list(recipients),
+            attachments=attachments or [],
+        )
+
+
+def _build_message(outbound, connection):
+    email = EmailMessage(
+        subject=outbound.subject,
+        body=outbound.html_body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=outbound.to,
+        connection=connection,
+    )
+    email.content_subtype = 'html'  # send as HTML
+    linked = []
+    for att in outbound.attachments:
+        try:
+            with default_storage.open(att['path'], 'rb') as f:
+                email.attach(att['filename'], f.read(), att.get('type', 'application/octet-stream'))
+        except OSError as e:
+            if not att.get('url'):
+                raise
+            print(f"[Email] #{outbound.pk}: cannot read {att['path']} ({e}), linking it instead")
+            linked.append(att)
+    if linked:
+        links = ''.join(f'<li><a href="{att["url"]}">{att["filename"]}</a></li>' for att in linked)
+        email.body += f'<hr><p><em>These files could not be attached; download them instead:</em></p><ul>{links}</ul>'
+    return email
+
+
+def _retry_delay(attempts):
+    base = getattr(settings, 'EMAIL_OUTBOX_BACKOFF', 30)
+    ceiling = getattr(settings, 'EMAIL_OUTBOX_BACKOFF_MAX', 60 * 60)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), ceiling))
+
+
+def _mark_failed(outbound, error, max_attempts):
+    outbound.last_error = f"{type(error).__name__}: {error}"
+    if outbound.attempts >= max_attempts:
+        outbound.status = OutboundEmail.STATUS_DEAD
+        print(f"[Email] Dead-lettered #{outbound.pk}: {outbound.last_error}")
+    else:
+        outbound.next_attempt_at = timezone.now() + _retry_delay(outbound.attempts)
+
+
+def send_outbox_batch(batch_size=50):
+    """Deliver up to ``batch_size`` due messages; return ``(sent, failed)``."""
+    max_attempts = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 8)
+    sent = failed = 0
+
+    with transaction.atomic():
+        # skip_locked lets several workers drain the same outbox; backends
+        # without SELECT ... FOR UPDATE (SQLite) simply ignore it.
+        batch = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=timezone.now())
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        if not batch:
+            return sent, failed
+
+        for outbound in batch:
+            outbound.attempts += 1
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            # Could not reach the server: the whole batch is retried later.
+            for outbound in batch:
+                _mark_failed(outbound, e, max_attempts)
+            failed = len(batch)
+        else:
+            try:
+                for outbound in batch:
+                    try:
+                        with span('smtp'):
+                            _build_message(outbound, connection).send(fail_silently=False)
+                    except Exception as e:
+                        failed += 1
+                        _mark_failed(outbound, e, max_attempts)
+                    else:
+                        sent += 1
+                        outbound.status = OutboundEmail.STATUS_SENT
+                        outbound.sent_at = timezone.now()
+                        outbound.last_error = ''
+            finally:
+                connection.close()
+
+        OutboundEmail.objects.bulk_update(
+            batch, ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at'],
+        )
+    print(f"[Email] Outbox batch: {sent} sent, {failed} failed")
+    return sent, failed
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from api.models import JobApplication
+from api.resume import MAX_EXPERIENCE_YEARS, experience_years, parse_resume
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill JobApplication.experience_years for rows that predate the column, and recheck rows "
+        "where an older parser clamped a year such as 'Since 2019' to the maximum."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--from-resume', action='store_true',
+            help="When the form's experience text has no number, parse the stored CV.",
+        )
+
+    def handle(self, *args, **options):
+        pending = (
+            JobApplication.objects
+            .filter(Q(experience_years__isnull=True) | Q(experience_years=MAX_EXPERIENCE_YEARS))
+            .only('id', 'experience', 'experience_years', 'cv').order_by('pk')
+        )
+        updated = scanned = last_pk = 0
+        while True:
+            # Walk by primary key so rows we could not fill are not read twice.
+            rows = list(pending.filter(pk__gt=last_pk)[:options['batch_size']])
+            if not rows:
+                break
+            last_pk = rows[-1].pk
+            scanned += len(rows)
+            batch = []
+            for application in rows:
+                years = experience_years(application.experience)
+                if years is None and options['from_resume'] and application.cv:
+                    try:
+                        with application.cv.open('rb') as f:
+                            parsed = parse_resume(f.read())
+                        years = experience_years(parsed['fields']['experience'])
+                    except Exception as e:
+                        self.stderr.write(f"#{application.pk}: could not parse CV ({e})")
+                if years != application.experience_years:
+                    application.experience_years = years
+                    batch.append(application)
+            updated += JobApplication.objects.bulk_update(batch, ['experience_years'])
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} of {scanned} application(s)."))
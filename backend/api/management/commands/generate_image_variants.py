@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.images import generate_variants
+from api.models import Post
+from api.signals import content_changed
+
+
+class Command(BaseCommand):
+    help = "Write missing post image variants and record each image's width (needed for its srcset)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Rewrite every variant, even if it exists.")
+
+    def handle(self, *args, **options):
+        changed = []
+        for post in Post.objects.exclude(image='').exclude(image=None).only('id', 'image', 'image_width'):
+            try:
+                width = generate_variants(post.image, only_missing=not options['force'], original_width=post.image_width)
+            except Exception as e:
+                self.stderr.write(f"#{post.pk}: could not resize {post.image.name} ({e})")
+                continue
+            if width != post.image_width:
+                post.image_width = width
+                post.updated_at = timezone.now()  # bulk_update skips auto_now; the ETags depend on it
+                changed.append(post)
+
+        Post.objects.bulk_update(changed, ['image_width', 'updated_at'])
+        if changed:
+            content_changed(Post)  # bulk_update sends no post_save
+        self.stdout.write(self.style.SUCCESS(f"Recorded the width of {len(changed)} image(s)."))
@@ -0,0 +1,173 @@
+import hashlib
+import sqlite3
+import time
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.dateparse import parse_datetime
+
+from migrate_to_mysql import TABLE_MAP
+
+
+def _normalize(value):
+    """A backend-independent form of one column value, for checksums."""
+    if isinstance(value, str):
+        parsed = parse_datetime(value) if len(value) >= 19 and value[4:5] == '-' and value[10:11] in ' T' else None
+        value = parsed or value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(dt_timezone.utc).replace(tzinfo=None)
+        # MySQL TIMESTAMP columns drop the microseconds.
+        return value.replace(microsecond=0).isoformat(' ')
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (float, Decimal)):
+        return repr(float(value))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return value
+
+
+def _sqlite_names(names):
+    return ', '.join(f'"{name}"' for name in names)
+
+
+def _checksum(cursor, sql, params=()):
+    """Row count and SHA-256 over the normalized rows a query returns."""
+    digest, count = hashlib.sha256(), 0
+    cursor.execute(sql, params)
+    while rows := cursor.fetchmany(1000):
+        for row in rows:
+            digest.update(repr(tuple(_normalize(v) for v in row)).encode())
+        count += len(rows)
+    return count, digest.hexdigest()
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the SQLite data straight into a DATABASES alias (the companion of migrate_to_mysql.py), "
+        "then verify row counts and checksums."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', default='db.sqlite3', help="SQLite database to read.")
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help="Target DATABASES alias.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per executemany and transaction.")
+        parser.add_argument('--tables', nargs='*', help="Only these tables (Django or MySQL names).")
+        parser.add_argument('--truncate', action='store_true', help="Empty each target table before loading.")
+        parser.add_argument('--verify-only', action='store_true', help="Skip loading; only compare counts and checksums.")
+
+    def handle(self, *args, **options):
+        try:
+            source = sqlite3.connect(f"file:{options['source']}?mode=ro", uri=True)
+        except sqlite3.Error as e:
+            raise CommandError(f"Cannot open {options['source']}: {e}")
+        alias = options['database']
+        if alias not in connections.databases:
+            raise CommandError(f"Unknown database alias '{alias}'.")
+        connection = connections[alias]
+        target_tables = set(connection.introspection.table_names())
+
+        selected = {
+            t: m for t, m in TABLE_MAP.items()
+            if not options['tables'] or t in options['tables'] or m in options['tables']
+        }
+        mismatched = []
+        try:
+            for django_table, mysql_table in selected.items():
+                # Hostinger schema names first, then a Django-migrated database.
+                target = mysql_table if mysql_table in target_tables else django_table
+                if target not in target_tables:
+                    self.stderr.write(f"[{mysql_table}] no such table in '{alias}', skipping")
+                    continue
+                columns = self._columns(source, connection, django_table, target)
+                if not columns:
+                    self.stderr.write(f"[{mysql_table}] {django_table} not found in source, skipping")
+                    continue
+                if not options['verify_only']:
+                    self._load(source, connection, alias, django_table, target, columns, options)
+                if not self._verify(source, connection, django_table, target, columns):
+                    mismatched.append(target)
+        finally:
+            source.close()
+
+        if mismatched:
+            raise CommandError(f"Verification failed for: {', '.join(mismatched)}")
+        self.stdout.write(self.style.SUCCESS("All tables match."))
+
+    def _columns(self, source, connection, django_table, target):
+        """``[(name, is_bool)]`` present in both the source and the target table."""
+        info = source.execute(f'PRAGMA table_info("{django_table}")').fetchall()
+        with connection.cursor() as cursor:
+            target_columns = {c.name for c in connection.introspection.get_table_description(cursor, target)}
+        return [(col[1], 'bool' in (col[2] or '').lower()) for col in info if col[1] in target_columns]
+
+    def _load(self, source, connection, alias, django_table, target, columns, options):
+        qn = connection.ops.quote_name
+        names = [name for name, _ in columns]
+        bool_flags = [is_bool for _, is_bool in columns]
+        insert = (
+            f"INSERT INTO {qn(target)} ({', '.join(qn(n) for n in names)}) "
+            f"VALUES ({', '.join(['%s'] * len(names))})"
+        )
+
+        with connection.cursor() as cursor:
+            if options['truncate']:
+                with transaction.atomic(using=alias):
+                    cursor.execute(f"DELETE FROM {qn(target)}")
+            # Rows are loaded in id order, so an interrupted run resumes after the last committed batch.
+            cursor.execute(f"SELECT MAX({qn('id')}) FROM {qn(target)}")
+            last_id = cursor.fetchone()[0] or 0
+            if last_id:
+                self.stdout.write(f"[{target}] resuming after id {last_id}")
+
+            total = source.execute(f'SELECT COUNT(*) FROM "{django_table}" WHERE id > ?', (last_id,)).fetchone()[0]
+            rows_in = source.execute(
+                f'SELECT {_sqlite_names(names)} FROM "{django_table}" WHERE id > ? ORDER BY id',
+                (last_id,),
+            )
+            loaded, started = 0, time.monotonic()
+            while batch := rows_in.fetchmany(options['batch_size']):
+                batch = [
+                    tuple(bool(v) if is_bool and v is not None else v for v, is_bool in zip(row, bool_flags))
+                    for row in batch
+                ]
+                with transaction.atomic(using=alias):
+                    cursor.executemany(insert, batch)
+                loaded += len(batch)
+                if options['verbosity'] >= 2 or loaded == total:
+                    rate = loaded / max(time.monotonic() - started, 1e-6)
+                    self.stdout.write(f"[{target}] {loaded}/{total} rows ({rate:,.0f} rows/s)")
+
+        self._reset_sequence(connection, target)
+        elapsed = time.monotonic() - started
+        self.stdout.write(f"[{target}] loaded {loaded} rows in {elapsed:.2f}s")
+
+    def _reset_sequence(self, connection, target):
+        """Move the id sequence past the explicit ids we inserted (PostgreSQL; a no-op elsewhere)."""
+        models = [m for m in apps.get_app_config('api').get_models() if m._meta.db_table == target]
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+
+    def _verify(self, source, connection, django_table, target, columns):
+        qn = connection.ops.quote_name
+        names = [name for name, _ in columns]
+        src = _checksum(
+            source.cursor(),
+            f'SELECT {_sqlite_names(names)} FROM "{django_table}" ORDER BY id',
+        )
+        # Booleans come back as 0/1 from SQLite and MySQL but as bool from PostgreSQL; _normalize evens that out.
+        with connection.cursor() as cursor:
+            dst = _checksum(cursor, f"SELECT {', '.join(qn(n) for n in names)} FROM {qn(target)} ORDER BY {qn('id')}")
+        if src == dst:
+            self.stdout.write(f"[{target}] verified {dst[0]} rows, checksum {dst[1][:12]}")
+            return True
+        self.stderr.write(f"[{target}] MISMATCH: source {src[0]} rows {src[1][:12]}, target {dst[0]} rows {dst[1][:12]}")
+        return False
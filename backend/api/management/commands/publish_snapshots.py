@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import JobOpening, Post, Service
+from api.snapshots import MANIFEST_NAME, get_root, get_url, publish
+
+SECTIONS = {'services': Service, 'jobs': JobOpening, 'posts': Post}
+
+
+class Command(BaseCommand):
+    help = "Render the public API payloads into content-hashed static JSON snapshots."
+
+    def add_arguments(self, parser):
+        parser.add_argument('sections', nargs='*', help=f"Any of: {', '.join(SECTIONS)} (default: all).")
+
+    def handle(self, *args, **options):
+        unknown = set(options['sections']) - set(SECTIONS)
+        if unknown:
+            raise CommandError(f"Unknown sections: {', '.join(sorted(unknown))}")
+        models = [SECTIONS[name] for name in options['sections']] or list(SECTIONS.values())
+        manifest = publish(models)
+        self.stdout.write(self.style.SUCCESS(
+            f"Published {len(manifest['files'])} snapshot(s) to {get_root()}; manifest at {get_url()}{MANIFEST_NAME}"
+        ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from api.models import Post
+from api.search import rebuild_index
+from api.signals import content_changed
+
+
+class Command(BaseCommand):
+    help = "Rebuild the post full-text search index from the posts table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        count = rebuild_index(options['database'])
+        content_changed(Post)  # drop cached search results
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} post(s)."))
@@ -0,0 +1,42 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import Post
+from api.rendering import content_hash, render_markdown
+from api.signals import content_changed
+
+
+class Command(BaseCommand):
+    help = "Render Post.content to HTML for every post whose source or renderer changed."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Re-render every post, even if its hash matches.")
+        parser.add_argument('--workers', type=int, default=None, help="Renderer processes (default: CPU count).")
+        parser.add_argument('--batch-size', type=int, default=200)
+
+    def handle(self, *args, **options):
+        stale = []
+        for post in Post.objects.only('id', 'content', 'content_hash').iterator(chunk_size=options['batch_size']):
+            digest = content_hash(post.content)
+            if options['force'] or digest != post.content_hash:
+                post.content_hash = digest
+                stale.append(post)
+
+        if not stale:
+            self.stdout.write("All posts are up to date.")
+            return
+
+        now = timezone.now()
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            rendered = pool.map(render_markdown, [post.content for post in stale], chunksize=16)
+            for post, html in zip(stale, rendered):
+                post.content_html = html
+                post.updated_at = now  # bulk_update skips auto_now, and ETags key on updated_at
+
+        Post.objects.bulk_update(
+            stale, ['content_html', 'content_hash', 'updated_at'], batch_size=options['batch_size'],
+        )
+        content_changed(Post)  # bulk_update sends no post_save
+        self.stdout.write(self.style.SUCCESS(f"Rendered {len(stale)} post(s)."))
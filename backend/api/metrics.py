@@ -0,0 +1,275 @@
+"""
+Request metrics per URL name, exported in Prometheus text format.
+
+``MetricsMiddleware`` records, for each request, the URL name from
+``api/urls.py``, the method and the status. It counts requests and tracks a
+latency histogram, response bytes, DB query count and DB time; the DB figures
+come from a ``connection.execute_wrapper`` around the view.
+
+Each gunicorn worker keeps its counters in memory and rewrites
+``METRICS_DIR/<pid>-<start ms>.json`` at most every ``METRICS_FLUSH_INTERVAL``
+seconds; the start time keeps a recycled pid from overwriting a dead worker's
+file. ``render_prometheus()`` sums the files of every worker, so any worker
+can answer a scrape. A scrape folds the files of dead workers into
+``aggregate.json`` and deletes them, so totals never go backwards and the
+directory does not grow with every worker restart.
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+try:
+    import fcntl
+except ImportError:  # Windows: scrapes are not locked across processes
+    fcntl = None
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+AGGREGATE_NAME = 'aggregate.json'
+
+
+def get_dir():
+    return getattr(settings, 'METRICS_DIR', None) or os.path.join(tempfile.gettempdir(), 'giggs-metrics')
+
+
+def _empty_series():
+    return {
+        'count': 0, 'latency_sum': 0.0, 'buckets': [0] * len(LATENCY_BUCKETS),
+        'bytes': 0, 'queries': 0, 'db_seconds': 0.0,
+    }
+
+
+class Registry:
+    """This process's counters, keyed by ``(view, method, status)``."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.series = {}
+        self.last_flush = 0.0
+        self.pid = None
+        self.filename = None
+
+    def get_filename(self):
+        # Set again after a fork (gunicorn --preload), where the pid changes.
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.filename = f'{self.pid}-{time.time_ns() // 1_000_000}.json'
+        return self.filename
+
+    def observe(self, view, method, status, seconds, size, queries, db_seconds):
+        key = f'{view}\t{method}\t{status}'
+        with self.lock:
+            s = self.series.setdefault(key, _empty_series())
+            s['count'] += 1
+            s['latency_sum'] += seconds
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    s['buckets'][i] += 1  # cumulative per Prometheus, so every bound above counts too
+            s['bytes'] += size
+            s['queries'] += queries
+            s['db_seconds'] += db_seconds
+
+    def flush(self, force=False):
+        now = time.monotonic()
+        if not force and now - self.last_flush < getattr(settings, 'METRICS_FLUSH_INTERVAL', 5):
+            return
+        with self.lock:
+            data = json.dumps(self.series)
+            self.last_flush = now
+        directory = get_dir()
+        os.makedirs(directory, exist_ok=True)
+        _write_atomic(os.path.join(directory, self.get_filename()), data)
+
+
+def _write_atomic(path, data):
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+        f.write(data)
+    os.replace(f'{path}.tmp', path)
+
+
+registry = Registry()
+atexit.register(lambda: registry.series and registry.flush(force=True))
+
+
+class QueryTimer:
+    """``execute_wrapper`` that counts queries and their wall time."""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.queries += 1
+
+
+def _response_size(response):
+    if response.streaming:
+        return int(response.get('Content-Length') or 0)
+    return len(response.content)
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timer = QueryTimer()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(timer))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        match = getattr(request, 'resolver_match', None)
+        view = (match.url_name or match.view_name) if match else 'unmatched'
+        try:
+            registry.observe(
+                view, request.method, response.status_code, elapsed,
+                _response_size(response), timer.queries, timer.seconds,
+            )
+            registry.flush()
+        except Exception as e:
+            print(f"[Metrics] Error: {e}")
+        return response
+
+
+# ─── Prometheus exposition ───
+
+def _read(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _add(totals, series):
+    for key, s in series.items():
+        t = totals.setdefault(key, _empty_series())
+        for field in ('count', 'latency_sum', 'bytes', 'queries', 'db_seconds'):
+            t[field] += s[field]
+        t['buckets'] = [a + b for a, b in zip(t['buckets'], s['buckets'])]
+
+
+def _parse_filename(filename):
+    """``"<pid>-<start>.json"`` -> ``(pid, start)``; raises ValueError for other names."""
+    pid, _, start = filename[:-len('.json')].partition('-')
+    return int(pid), int(start or 0)
+
+
+def _is_alive(pid):
+    if os.name == 'nt':
+        return True  # os.kill(pid, 0) would signal it; dead workers' files are just kept
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # alive, under another user
+    return True
+
+
+@contextmanager
+def _collect_lock(directory):
+    with open(os.path.join(directory, '.lock'), 'w') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _fold_dead_workers(directory, workers):
+    """Add dead workers' series to the aggregate, delete their files and return the aggregate.
+
+    A worker is dead when its pid is gone or a newer process has the same
+    pid. Folded names are recorded with the aggregate, so a file that
+    survives a crash before its deletion is never counted twice.
+    """
+    path = os.path.join(directory, AGGREGATE_NAME)
+    aggregate = _read(path) or {'series': {}, 'folded': []}
+    newest = {}
+    for pid, start in workers.values():
+        newest[pid] = max(newest.get(pid, start), start)
+    dead = [filename for filename, (pid, start) in workers.items() if start < newest[pid] or not _is_alive(pid)]
+    folded = {filename for filename in aggregate['folded'] if filename in workers}
+    if not dead and len(folded) == len(aggregate['folded']):
+        return aggregate
+
+    for filename in dead:
+        if filename not in folded:
+            _add(aggregate['series'], _read(os.path.join(directory, filename)) or {})
+            folded.add(filename)
+    aggregate['folded'] = sorted(folded)
+    _write_atomic(path, json.dumps(aggregate))
+    for filename in dead:
+        try:
+            os.remove(os.path.join(directory, filename))
+            workers.pop(filename)
+        except OSError:
+            pass
+    return aggregate
+
+
+def collect():
+    """Sum the series of every worker that has flushed, live or dead."""
+    registry.flush(force=True)
+    directory = get_dir()
+    with _collect_lock(directory):
+        workers = {}
+        for filename in os.listdir(directory):
+            if filename.endswith('.json') and filename != AGGREGATE_NAME:
+                try:
+                    workers[filename] = _parse_filename(filename)
+                except ValueError:
+                    continue
+        aggregate = _fold_dead_workers(directory, workers)
+        totals = {}
+        _add(totals, aggregate['series'])
+        for filename in workers:
+            if filename not in aggregate['folded']:
+                _add(totals, _read(os.path.join(directory, filename)) or {})
+    return totals
+
+
+# Counters with one sample per series: (metric, field, help)
+COUNTERS = (
+    ('giggs_http_requests_total', 'count', 'Requests by URL name, method and status.'),
+    ('giggs_http_response_bytes_total', 'bytes', 'Response body bytes (streamed responses count their Content-Length).'),
+    ('giggs_db_queries_total', 'queries', 'SQL queries run while handling requests.'),
+    ('giggs_db_query_seconds_total', 'db_seconds', 'Time spent in SQL queries while handling requests.'),
+)
+
+
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{k}="{escape(v)}"' for k, v in labels.items()) + '}'
+
+
+def render_prometheus():
+    series = [(dict(zip(('view', 'method', 'status'), key.split('\t'))), s) for key, s in sorted(collect().items())]
+    lines = []
+    for name, field, help_text in COUNTERS:
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+        lines += [f'{name}{_labels(**labels)} {round(s[field], 6)}' for labels, s in series]
+
+    name = 'giggs_http_request_duration_seconds'
+    lines += [f'# HELP {name} Time spent in Django per request.', f'# TYPE {name} histogram']
+    for labels, s in series:
+        for bound, count in zip(LATENCY_BUCKETS, s['buckets']):
+            lines.append(f'{name}_bucket{_labels(**labels, le=bound)} {count}')
+        lines.append(f'{name}_bucket{_labels(**labels, le="+Inf")} {s["count"]}')
+        lines.append(f'{name}_sum{_labels(**labels)} {s["latency_sum"]:.6f}')
+        lines.append(f'{name}_count{_labels(**labels)} {s["count"]}')
+    return '\n'.join(lines) + '\n'
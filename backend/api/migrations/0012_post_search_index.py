@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    from api.search import create_index, rebuild_index
+    create_index(schema_editor.connection)
+    if schema_editor.connection.vendor == 'sqlite':
+        rebuild_index(schema_editor.connection.alias)  # index the posts that already exist
+
+
+def drop_search_index(apps, schema_editor):
+    from api.search import drop_index
+    drop_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_post_content_html'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
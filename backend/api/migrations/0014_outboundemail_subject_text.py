@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_jobapplication_experience_years'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboundemail',
+            name='subject',
+            field=models.TextField(),
+        ),
+    ]
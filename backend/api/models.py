@@ -1,4 +1,8 @@
 from django.db import models
+from django.utils import timezone
+
+from .rendering import content_hash, render_markdown
+from .resume import experience_years
 
 
 class ContactMessage(models.Model):
@@ -7,6 +11,12 @@ class ContactMessage(models.Model):
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # keyset pagination in the admin list (api/pagination.py)
+            models.Index(fields=['-created_at', '-id'], name='contact_created_id_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} <{self.email}>"
 
@@ -18,6 +28,7 @@ class JobApplication(models.Model):
     age = models.PositiveIntegerField(null=True, blank=True)
     qualification = models.CharField(max_length=200, blank=True)
     experience = models.CharField(max_length=100, blank=True)
+    experience_years = models.PositiveSmallIntegerField(null=True, blank=True)  # normalized from `experience` for filtering
     address = models.TextField(blank=True)
     current_ctc = models.CharField(max_length=50, blank=True)
     expected_ctc = models.CharField(max_length=50, blank=True)
@@ -28,9 +39,23 @@ class JobApplication(models.Model):
     cv = models.FileField(upload_to='cvs/')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # keyset pagination in the admin list (api/pagination.py)
+            models.Index(fields=['-created_at', '-id'], name='application_created_id_idx'),
+            # admin filters (api/filters.py): position / experience, then newest first
+            models.Index(fields=['job_title', '-created_at', '-id'], name='application_title_idx'),
+            models.Index(fields=['experience_years', '-created_at', '-id'], name='application_experience_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.email}) — {self.job_title}"
 
+    def save(self, *args, **kwargs):
+        if self.experience_years is None:
+            self.experience_years = experience_years(self.experience)
+        super().save(*args, **kwargs)
+
 
 class Post(models.Model):
     CATEGORY_CHOICES = [
@@ -44,7 +69,10 @@ class Post(models.Model):
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default='Article')
     excerpt = models.TextField(blank=True)
     content = models.TextField()  # markdown text
+    content_html = models.TextField(blank=True, editable=False)  # rendered + sanitized on save
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)  # source + renderer hash of content_html
     image = models.ImageField(upload_to='posts/', null=True, blank=True)
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)  # pixels, set with the variants (api/images.py)
     embed_url = models.URLField(max_length=500, blank=True, null=True, help_text="If provided, this post will render as an iframe (e.g. LinkedIn embed)")
     order = models.PositiveIntegerField(default=0)
     is_published = models.BooleanField(default=True)
@@ -57,6 +85,23 @@ class Post(models.Model):
     def __str__(self):
         return f"[{self.category}] {self.title}"
 
+    def render_content(self, force=False):
+        """Refresh ``content_html`` if the source or renderer changed; return True if it did."""
+        digest = content_hash(self.content)
+        if not force and digest == self.content_hash:
+            return False
+        self.content_html = render_markdown(self.content)
+        self.content_hash = digest
+        return True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.render_content()
+        elif 'content' in update_fields and self.render_content():
+            kwargs['update_fields'] = {*update_fields, 'content_html', 'content_hash'}
+        super().save(*args, **kwargs)
+
 
 class JobOpening(models.Model):
     title = models.CharField(max_length=200)
@@ -95,3 +140,34 @@ class Service(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class OutboundEmail(models.Model):
+    """Outbox row for a notification email; delivered by ``manage.py send_outbox``."""
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_DEAD = 'dead'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_DEAD, 'Dead'),
+    ]
+    subject = models.TextField()  # built from user input (name, job title), so no length cap
+    html_body = models.TextField()
+    to = models.JSONField(default=list)  # list of recipient addresses
+    attachments = models.JSONField(default=list, blank=True)  # [{filename, path, type}] — path is a storage name
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.status}] {self.subject}"
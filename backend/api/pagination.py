@@ -0,0 +1,112 @@
+"""
+Keyset (cursor) pagination over ``(created_at, id)``.
+
+Each page filters on the last row of the previous one instead of using an
+OFFSET, so with the composite index a deep page costs the same as the first.
+A ``previous`` cursor walks the same index the other way from the first row
+of the page.
+"""
+import base64
+import binascii
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Newest-first pages keyed on ``(created_at, id)`` with an opaque cursor."""
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            rows = list(queryset.order_by('-created_at', '-id')[:page_size + 1])
+            self.has_next, self.has_previous = len(rows) > page_size, False
+            self.page = rows[:page_size]
+            return self.page
+
+        created_at, pk, backwards = self.decode_cursor(cursor)
+        # One extra row tells us whether there is another page in that direction.
+        if backwards:
+            rows = list(
+                queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+                .order_by('created_at', 'id')[:page_size + 1]
+            )
+            self.has_next, self.has_previous = True, len(rows) > page_size
+            self.page = rows[:page_size][::-1]
+        else:
+            rows = list(
+                queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+                .order_by('-created_at', '-id')[:page_size + 1]
+            )
+            self.has_next, self.has_previous = len(rows) > page_size, True
+            self.page = rows[:page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        default = getattr(settings, 'ADMIN_PAGE_SIZE', 50)
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return default
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, row, backwards=False):
+        raw = f'{row.created_at.isoformat()}|{row.pk}|{"p" if backwards else "n"}'
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Return ``(created_at, id, backwards)``."""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            created_at, pk, direction = base64.urlsafe_b64decode(padded).decode().split('|')
+            created_at = parse_datetime(created_at)
+            pk = int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError({self.cursor_query_param: self.invalid_cursor_message})
+        if created_at is None or direction not in ('n', 'p'):
+            raise ValidationError({self.cursor_query_param: self.invalid_cursor_message})
+        return created_at, pk, direction == 'p'
+
+    def _link(self, row, backwards):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(row, backwards))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], backwards=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], backwards=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,35 @@
+"""
+Markdown → sanitized HTML for ``Post.content``.
+
+Posts are rendered once when saved and the HTML is stored next to a hash of
+the source and the renderer configuration, so an unchanged post is never
+rendered twice. Bump ``RENDERER_VERSION`` after changing the extensions or
+the sanitizer rules, then run ``manage.py render_posts``.
+"""
+import hashlib
+
+import markdown
+import nh3
+
+RENDERER_VERSION = 1
+MARKDOWN_EXTENSIONS = ['extra', 'sane_lists']
+
+ALLOWED_TAGS = set(nh3.ALLOWED_TAGS)
+ALLOWED_ATTRIBUTES = {tag: set(attrs) for tag, attrs in nh3.ALLOWED_ATTRIBUTES.items()}
+ALLOWED_ATTRIBUTES.setdefault('code', set()).add('class')  # language-* from fenced code blocks
+ALLOWED_ATTRIBUTES.setdefault('img', set()).update({'src', 'alt', 'title'})
+
+
+def renderer_signature():
+    """Everything besides the source text that changes the rendered output."""
+    return f"{RENDERER_VERSION}:markdown-{markdown.__version__}:{','.join(MARKDOWN_EXTENSIONS)}"
+
+
+def content_hash(content):
+    return hashlib.sha256(f"{renderer_signature()}\0{content}".encode()).hexdigest()
+
+
+def render_markdown(content):
+    """Render markdown to HTML and strip anything unsafe."""
+    html = markdown.markdown(content or '', extensions=MARKDOWN_EXTENSIONS, output_format='html')
+    return nh3.clean(html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, link_rel='noopener noreferrer')
@@ -0,0 +1,231 @@
+"""
+Resume parsing: PDF text extraction in a bounded process pool, field
+extraction, and a content-hash cache of both.
+
+PyPDF2 is pure Python and can spend a long time on large or malformed
+files, so extraction runs in worker processes rather than on the request
+worker. Only the first ``RESUME_PARSE_MAX_PAGES`` pages are read and every
+job has a wall-clock timeout. At most ``RESUME_PARSE_WORKERS`` jobs are in
+flight, so every submitted job starts at once and its timeout measures the
+parse, not time spent queued; further uploads are turned away with 503.
+
+Results are cached by the SHA-256 of the file, so the same PDF sent to
+``parse-resume/`` and then ``apply/`` (or re-uploaded) is parsed once.
+"""
+import hashlib
+import io
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import PyPDF2
+from django.conf import settings
+from django.core.cache import caches
+
+from .timing import span
+
+
+class ParserBusy(Exception):
+    """Too many resumes are being parsed already."""
+
+
+class ParseTimeout(Exception):
+    """The PDF took longer than ``RESUME_PARSE_TIMEOUT`` to extract."""
+
+
+def extract_pdf_text(data, max_pages):
+    """Return the text of the first ``max_pages`` pages of a PDF."""
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    text = ''
+    for page in reader.pages[:max_pages]:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + '\n'
+    return text
+
+
+_lock = threading.Lock()
+_pool = None
+_slots = None
+
+
+def _get_pool():
+    global _pool, _slots
+    with _lock:
+        if _pool is None:
+            workers = getattr(settings, 'RESUME_PARSE_WORKERS', 2)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            # One slot per process: a job never waits in the pool's queue.
+            _slots = threading.BoundedSemaphore(workers)
+        return _pool, _slots
+
+
+def _reset_pool(pool):
+    """Kill the pool's processes so a runaway parse cannot keep its CPU."""
+    global _pool
+    with _lock:
+        if _pool is not pool:
+            return
+        _pool = None
+    # ProcessPoolExecutor cannot cancel a running job, so the workers are
+    # terminated; other in-flight jobs fail with BrokenProcessPool.
+    for process in list(getattr(pool, '_processes', {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_pdf(data):
+    """Extract resume text from PDF bytes in the process pool.
+
+    Raises :class:`ParserBusy` when every worker is busy, :class:`ParseTimeout`
+    when extraction exceeds its budget, and re-raises PyPDF2 errors.
+    """
+    pool, slots = _get_pool()
+    if not slots.acquire(blocking=False):
+        raise ParserBusy()
+    try:
+        future = pool.submit(extract_pdf_text, data, getattr(settings, 'RESUME_PARSE_MAX_PAGES', 3))
+    except BaseException:
+        slots.release()
+        raise
+    # The slot is held until the job really finishes, not just until we stop waiting.
+    future.add_done_callback(lambda f: slots.release())
+
+    try:
+        return future.result(timeout=getattr(settings, 'RESUME_PARSE_TIMEOUT', 10))
+    except TimeoutError:
+        _reset_pool(pool)
+        raise ParseTimeout()
+    except BrokenProcessPool:
+        _reset_pool(pool)
+        raise ParserBusy()
+
+
+# ─── Field extraction ───
+# Patterns are compiled once at import; extract_fields() makes one pass over
+# the lines for both the name and the address.
+
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# Indian & international formats
+PHONE_RE = re.compile(r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3,5}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}')
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[a-zA-Z0-9_-]+/?', re.IGNORECASE)
+LONG_NUMBER_RE = re.compile(r'\d{5,}')
+NAME_RE = re.compile(r'^[A-Za-z\s.\'-]+$')
+# 6-digit Indian PIN or 5-digit US ZIP (a ZIP+4 still contains the 5-digit word)
+POSTCODE_RE = re.compile(r'\b\d{5,6}\b')
+ADDRESS_KEYWORDS = (
+    'address', 'city', 'state', 'district', 'nagar', 'colony',
+    'street', 'road', 'lane', 'sector', 'block', 'plot',
+    'apartment', 'flat', 'floor', 'tower', 'phase',
+    'delhi', 'mumbai', 'bangalore', 'hyderabad', 'chennai',
+    'kolkata', 'pune', 'noida', 'gurgaon', 'gurugram',
+    'india', 'maharashtra', 'karnataka', 'tamil nadu',
+    'uttar pradesh', 'haryana', 'rajasthan', 'kerala',
+)
+# Substring match, like `kw in line`, for all keywords in one scan.
+ADDRESS_KEYWORD_RE = re.compile('|'.join(re.escape(kw) for kw in ADDRESS_KEYWORDS))
+EXPERIENCE_RES = (
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)?', re.IGNORECASE),
+    re.compile(r'(?:experience|exp)[\s:]*(\d+)\+?\s*(?:years?|yrs?)', re.IGNORECASE),
+)
+NAME_LINES = 5  # the name is looked for in the first few non-empty lines
+
+
+def extract_fields(text):
+    """Use regex to extract common resume fields from raw text."""
+    data = {
+        'name': '',
+        'email': '',
+        'phone': '',
+        'linkedin': '',
+        'qualification': '',
+        'experience': '',
+        'address': '',
+    }
+
+    email_match = EMAIL_RE.search(text)
+    if email_match:
+        data['email'] = email_match.group()
+
+    phone_match = PHONE_RE.search(text)
+    if phone_match:
+        data['phone'] = phone_match.group().strip()
+
+    linkedin_match = LINKEDIN_RE.search(text)
+    if linkedin_match:
+        url = linkedin_match.group()
+        if not url.startswith('http'):
+            url = 'https://' + url
+        data['linkedin'] = url
+
+    # Name: first short, alphabetical line among the first NAME_LINES that is
+    # not an email/phone/url. Address: first line with a PIN/ZIP code or an
+    # address keyword that is not an email/url.
+    index = 0
+    for raw_line in text.split('\n'):
+        line = raw_line.strip()
+        if not line:
+            continue
+        line_lower = line.lower()
+        is_contact = '@' in line or 'linkedin' in line_lower or 'http' in line_lower
+
+        if (index < NAME_LINES and not data['name'] and not is_contact
+                and len(line) < 60 and not LONG_NUMBER_RE.search(line) and NAME_RE.match(line)):
+            data['name'] = line
+        if (not data['address'] and not is_contact
+                and (POSTCODE_RE.search(line) or ADDRESS_KEYWORD_RE.search(line_lower))):
+            data['address'] = line[:300]
+        if data['address'] and (data['name'] or index >= NAME_LINES - 1):
+            break
+        index += 1
+
+    for pattern in EXPERIENCE_RES:
+        exp_match = pattern.search(text)
+        if exp_match:
+            data['experience'] = f'{exp_match.group(1)} years'
+            break
+
+    return data
+
+
+EXPERIENCE_VALUE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*\+?\s*(months?|mos?)?', re.IGNORECASE)
+MAX_EXPERIENCE_YEARS = 80
+
+
+def experience_years(value):
+    """Whole years from free text such as '3 years', '2+ yrs', '18 months' or '1.5'.
+
+    Returns None when the text holds no number, or when the number is too
+    large to be years of experience (a year such as 'Since 2019').
+    """
+    match = EXPERIENCE_VALUE_RE.search(value or '')
+    if not match:
+        return None
+    amount = float(match.group(1))
+    if match.group(2):  # months
+        amount /= 12
+    return int(amount) if amount <= MAX_EXPERIENCE_YEARS else None
+
+
+def get_cached_resume(digest):
+    """Cached ``{'text', 'fields'}`` for a file's SHA-256 hex digest, or None."""
+    cache = caches[getattr(settings, 'RESUME_CACHE_ALIAS', 'resumes')]
+    return cache.get(f'resume:{digest}')
+
+
+def parse_resume(data, digest=None):
+    """Return ``{'text', 'fields'}`` for PDF bytes, parsing only on a cache miss.
+
+    ``digest`` is the SHA-256 hex digest of ``data`` when the caller already
+    has it. Raises the same errors as :func:`parse_pdf`.
+    """
+    if digest is None:
+        digest = hashlib.sha256(data).hexdigest()
+    result = get_cached_resume(digest)
+    if result is None:
+        with span('pdf'):
+            text = parse_pdf(data)
+            result = {'text': text, 'fields': extract_fields(text)}
+        caches[getattr(settings, 'RESUME_CACHE_ALIAS', 'resumes')].set(f'resume:{digest}', result)
+    return result
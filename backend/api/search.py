@@ -0,0 +1,187 @@
+"""
+Full-text search over posts.
+
+Each database uses its own index, created by migration 0012:
+
+* SQLite (dev): an FTS5 table ``api_post_fts`` whose rowid is the post id,
+  kept in sync from the ``Post`` save/delete signals.
+* MySQL: a FULLTEXT index on ``api_post(title, excerpt, content)``.
+* PostgreSQL: a GIN index on the ``to_tsvector`` of the same columns.
+
+MySQL and PostgreSQL maintain their indexes themselves, so the signal hooks
+do nothing there. Any other database falls back to an unindexed
+``icontains`` scan. Snippets come back as HTML with matches wrapped in
+``<mark>``; everything else in them is escaped.
+"""
+import html
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+FTS_TABLE = 'api_post_fts'
+MYSQL_INDEX = 'post_fulltext_idx'
+POSTGRES_INDEX = 'post_search_idx'
+POSTGRES_DOCUMENT = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(excerpt, '') || ' ' || coalesce(content, ''))"
+)
+# Highlight markers from the private-use area, swapped for <mark> after escaping.
+MARK_START, MARK_END = '\ue000', '\ue001'
+SNIPPET_WORDS = 24
+
+WORD_RE = re.compile(r'\w+')
+
+
+def _highlight(snippet):
+    return html.escape(snippet).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+# ─── Index DDL (used by the migration and rebuild_search_index) ───
+
+def create_index(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                f"USING fts5(title, excerpt, content, tokenize='porter unicode61')"
+            )
+        elif connection.vendor == 'mysql':
+            cursor.execute(f"ALTER TABLE api_post ADD FULLTEXT INDEX {MYSQL_INDEX} (title, excerpt, content)")
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {POSTGRES_INDEX} ON api_post USING GIN ({POSTGRES_DOCUMENT})")
+
+
+def drop_index(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+        elif connection.vendor == 'mysql':
+            cursor.execute(f"ALTER TABLE api_post DROP INDEX {MYSQL_INDEX}")
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f"DROP INDEX IF EXISTS {POSTGRES_INDEX}")
+
+
+def rebuild_index(using='default'):
+    """Rebuild the search index from scratch; return the number of posts indexed."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, excerpt, content) "
+                f"SELECT id, title, excerpt, content FROM api_post"
+            )
+            cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f"REINDEX INDEX {POSTGRES_INDEX}")
+        else:
+            drop_index(connection)
+            create_index(connection)
+        cursor.execute("SELECT COUNT(*) FROM api_post")
+        return cursor.fetchone()[0]
+
+
+# ─── Signal hooks (SQLite only; the other backends index by themselves) ───
+
+def index_post(post, using='default'):
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post.pk])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, excerpt, content) VALUES (%s, %s, %s, %s)",
+            [post.pk, post.title, post.excerpt, post.content],
+        )
+
+
+def remove_post(post_id, using='default'):
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [post_id])
+
+
+# ─── Queries ───
+
+def search_posts(query, limit=20, using='default'):
+    """Ranked ``[(post_id, rank, snippet_html), ...]`` for published posts, best first."""
+    words = WORD_RE.findall(query)
+    if not words:
+        return []
+    connection = connections[using]
+    vendor = connection.vendor
+    with connection.cursor() as cursor:
+        if vendor == 'sqlite':
+            # Quote every word so user input cannot inject FTS5 syntax; the
+            # last one is a prefix so results show up while typing.
+            match = ' '.join(f'"{w}"' for w in words) + '*'
+            cursor.execute(
+                f"SELECT p.id, -bm25({FTS_TABLE}, 10.0, 4.0, 1.0) AS rank, "
+                f"snippet({FTS_TABLE}, -1, %s, %s, '…', %s) "
+                f"FROM {FTS_TABLE} JOIN api_post p ON p.id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH %s AND p.is_published "
+                f"ORDER BY rank DESC LIMIT %s",
+                [MARK_START, MARK_END, SNIPPET_WORDS, match, limit],
+            )
+            return [(pk, rank, _highlight(snippet)) for pk, rank, snippet in cursor.fetchall()]
+
+        if vendor == 'postgresql':
+            options = f'StartSel={MARK_START}, StopSel={MARK_END}, MaxWords={SNIPPET_WORDS}, MinWords=8'
+            cursor.execute(
+                f"SELECT id, ts_rank({POSTGRES_DOCUMENT}, q) AS rank, "
+                f"ts_headline('english', coalesce(excerpt, '') || ' ' || content, q, %s) "
+                f"FROM api_post, plainto_tsquery('english', %s) q "
+                f"WHERE is_published AND {POSTGRES_DOCUMENT} @@ q "
+                f"ORDER BY rank DESC LIMIT %s",
+                [options, ' '.join(words), limit],
+            )
+            return [(pk, rank, _highlight(snippet)) for pk, rank, snippet in cursor.fetchall()]
+
+        if vendor == 'mysql':
+            cursor.execute(
+                "SELECT id, MATCH(title, excerpt, content) AGAINST (%s IN NATURAL LANGUAGE MODE) AS rank_, "
+                "excerpt, content FROM api_post "
+                "WHERE is_published AND MATCH(title, excerpt, content) AGAINST (%s IN NATURAL LANGUAGE MODE) "
+                "ORDER BY rank_ DESC LIMIT %s",
+                [' '.join(words), ' '.join(words), limit],
+            )
+            return [(pk, rank, _highlight(_snippet(f'{excerpt} {content}', words)))
+                    for pk, rank, excerpt, content in cursor.fetchall()]
+
+    return _search_unindexed(words, limit, using)
+
+
+def _search_unindexed(words, limit, using):
+    """``icontains`` on every word, ranked like the indexes weigh the columns (title 10, excerpt 4, content 1)."""
+    from .models import Post
+
+    queryset = Post.objects.using(using).filter(is_published=True)
+    for word in words:
+        queryset = queryset.filter(Q(title__icontains=word) | Q(excerpt__icontains=word) | Q(content__icontains=word))
+    hits = []
+    for pk, title, excerpt, content in queryset.values_list('id', 'title', 'excerpt', 'content'):
+        rank = sum(
+            weight * text.lower().count(word.lower())
+            for word in words for weight, text in ((10, title), (4, excerpt or ''), (1, content))
+        )
+        hits.append((pk, float(rank), _highlight(_snippet(f'{excerpt} {content}', words))))
+    return sorted(hits, key=lambda hit: hit[1], reverse=True)[:limit]
+
+
+def _snippet(text, words):
+    """Window of SNIPPET_WORDS words around the first match, with matches marked."""
+    wanted = {w.lower() for w in words}
+
+    def matches(token):
+        return any(w.lower() in wanted for w in WORD_RE.findall(token))
+
+    tokens = text.split()
+    first = next((i for i, token in enumerate(tokens) if matches(token)), 0)
+    start = max(0, first - SNIPPET_WORDS // 3)
+    window = [
+        f'{MARK_START}{token}{MARK_END}' if matches(token) else token
+        for token in tokens[start:start + SNIPPET_WORDS]
+    ]
+    return ('…' if start else '') + ' '.join(window) + ('…' if start + SNIPPET_WORDS < len(tokens) else '')
@@ -1,39 +1,79 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import ContactMessage, JobApplication, Post, JobOpening, Service
+from .images import image_srcsets
+from .timing import TimedSerializerMixin
 
 
-class ContactMessageSerializer(serializers.ModelSerializer):
+class DynamicFieldsMixin:
+    """Accepts ``fields=[...]`` to serialize only a subset of ``Meta.fields``."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def only_fields(cls, fields=None):
+        """Model columns needed to serialize ``fields`` (default: all), for ``QuerySet.only()``."""
+        columns = {f.name for f in cls.Meta.model._meta.concrete_fields}
+        sources = getattr(cls.Meta, 'field_sources', {})
+        needed = []
+        for name in fields or cls.Meta.fields:
+            needed.extend(sources.get(name, [name] if name in columns else []))
+        return list(dict.fromkeys(needed))
+
+
+class ImageVariantsMixin(serializers.Serializer):
+    """``image_variants``: a ``srcset`` string per format for ``Post.image`` (see api/images.py)."""
+    image_variants = serializers.SerializerMethodField()
+
+    def get_image_variants(self, obj):
+        return image_srcsets(obj, self.context.get('request'))
+
+
+class ContactMessageSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = ContactMessage
         fields = ['id', 'name', 'email', 'message', 'created_at']
 
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobApplicationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = JobApplication
         fields = [
             'id', 'name', 'email', 'phone', 'age',
-            'qualification', 'experience', 'address',
+            'qualification', 'experience', 'experience_years', 'address',
             'current_ctc', 'expected_ctc',
             'linkedin', 'portfolio',
             'job_title', 'message', 'cv', 'created_at',
         ]
+        read_only_fields = ['experience_years']
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(TimedSerializerMixin, ImageVariantsMixin, serializers.ModelSerializer):
     class Meta:
         model = Post
-        fields = ['id', 'title', 'slug', 'category', 'excerpt', 'content', 'image', 'embed_url', 'order', 'is_published', 'created_at', 'updated_at']
+        fields = ['id', 'title', 'slug', 'category', 'excerpt', 'content', 'content_html', 'image', 'image_variants', 'embed_url', 'order', 'is_published', 'created_at', 'updated_at']
 
 
-class JobOpeningSerializer(serializers.ModelSerializer):
+class PostSummarySerializer(TimedSerializerMixin, DynamicFieldsMixin, ImageVariantsMixin, serializers.ModelSerializer):
+    """Card fields only — used by list responses, which never load ``content``."""
+    class Meta:
+        model = Post
+        fields = ['id', 'title', 'slug', 'category', 'excerpt', 'image', 'image_variants', 'embed_url', 'order', 'is_published', 'created_at', 'updated_at']
+        field_sources = {'image_variants': ['image', 'image_width']}
+
+
+class JobOpeningSerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = JobOpening
         fields = ['id', 'title', 'location', 'type', 'description', 'is_active', 'created_at', 'updated_at']
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(TimedSerializerMixin, DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = [
@@ -43,7 +83,21 @@ class ServiceSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at',
         ]
 
-class UserSerializer(serializers.ModelSerializer):
+class ServiceBatchItemSerializer(serializers.Serializer):
+    """One row of an admin batch edit: ``{id, order?, is_active?}``."""
+    id = serializers.IntegerField()
+    order = serializers.IntegerField(min_value=0, required=False)
+    is_active = serializers.BooleanField(required=False)
+
+
+class PostBatchItemSerializer(serializers.Serializer):
+    """One row of an admin batch edit: ``{id, order?, is_published?}``."""
+    id = serializers.IntegerField()
+    order = serializers.IntegerField(min_value=0, required=False)
+    is_published = serializers.BooleanField(required=False)
+
+
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'password', 'is_staff', 'is_superuser']
@@ -0,0 +1,38 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import search, snapshots
+from .cache import bump_version
+from .models import JobOpening, Post, Service
+
+
+def content_changed(model):
+    """Invalidate everything derived from the public rows of ``model``."""
+    bump_version(model)
+    if getattr(settings, 'SNAPSHOT_PUBLISH_ON_SAVE', False):
+        transaction.on_commit(partial(snapshots.publish_on_commit, model))
+
+
+@receiver([post_save, post_delete], sender=Post)
+@receiver([post_save, post_delete], sender=Service)
+@receiver([post_save, post_delete], sender=JobOpening)
+def invalidate_public_content(sender, **kwargs):
+    content_changed(sender)
+
+
+SEARCHABLE_FIELDS = {'title', 'excerpt', 'content'}
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, using, update_fields=None, **kwargs):
+    if update_fields is None or SEARCHABLE_FIELDS & set(update_fields):
+        search.index_post(instance, using)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, using, **kwargs):
+    search.remove_post(instance.pk, using)
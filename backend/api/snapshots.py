@@ -0,0 +1,201 @@
+"""
+Static JSON snapshots of the public API, served by WhiteNoise.
+
+``publish()`` renders the payloads of the public views (services, jobs, the
+post list and every post by slug) into content-hashed files under
+``SNAPSHOT_ROOT``, with gzip/brotli variants, and records them in
+``manifest.json``::
+
+    {"generated_at": "...", "files": {"services.json": "services.1a2b3c4d5e6f.json",
+                                      "posts/my-slug.json": "posts/my-slug.0f9e8d7c6b5a.json"}}
+
+Clients read the manifest (``max-age=0``, revalidated by ETag) and then fetch
+the hashed files, which never change and are served with far-future
+``immutable`` headers by ``SnapshotMiddleware`` without touching Python views
+or the database.
+
+Publishing runs from ``manage.py publish_snapshots`` and, with
+``SNAPSHOT_PUBLISH_ON_SAVE``, after every commit that changes public content
+(see ``api/signals.py``).
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from whitenoise.base import WhiteNoise
+from whitenoise.compress import Compressor
+from whitenoise.middleware import WhiteNoiseMiddleware
+from whitenoise.string_utils import ensure_leading_trailing_slash
+
+try:
+    import fcntl
+except ImportError:  # Windows: publishing is not locked across processes
+    fcntl = None
+
+from .models import JobOpening, Post, Service
+
+MANIFEST_NAME = 'manifest.json'
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.json$')
+
+
+def get_root():
+    return str(getattr(settings, 'SNAPSHOT_ROOT', settings.BASE_DIR / 'snapshots'))
+
+
+def get_url():
+    return ensure_leading_trailing_slash(getattr(settings, 'SNAPSHOT_URL', '/snapshots/'))
+
+
+def _serializer_context():
+    # Image fields serialize as absolute URLs when there is a request.
+    base_url = getattr(settings, 'SNAPSHOT_BASE_URL', '')
+    if not base_url:
+        return {}
+    scheme, _, host = base_url.rstrip('/').partition('://')
+    request = RequestFactory().get('/', HTTP_HOST=host, secure=scheme == 'https')
+    return {'request': request}
+
+
+def render_payloads(models):
+    """Yield ``(logical_name, data)`` for every snapshot built from ``models``."""
+    from .views import JobOpeningListView, PostDetailView, PostListView, ServiceListView
+
+    context = _serializer_context()
+    for model, name, view in (
+        (Service, 'services.json', ServiceListView),
+        (JobOpening, 'jobs.json', JobOpeningListView),
+        (Post, 'posts.json', PostListView),
+    ):
+        if model in models:
+            yield name, view.serializer_class(view.queryset.all(), many=True, context=context).data
+    if Post in models:
+        for post in PostDetailView.queryset.all().iterator(chunk_size=200):
+            yield f'posts/{post.slug}.json', PostDetailView.serializer_class(post, context=context).data
+
+
+def _sections(models):
+    """Logical-name prefixes fully rewritten when ``models`` are published."""
+    prefixes = set()
+    if Service in models:
+        prefixes.add('services.json')
+    if JobOpening in models:
+        prefixes.add('jobs.json')
+    if Post in models:
+        prefixes.update({'posts.json', 'posts/'})
+    return prefixes
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_snapshot(root, name, data, compressor):
+    """Write one payload under its content-hashed name; return that name."""
+    body = JSONRenderer().render(data)
+    stem = name[:-len('.json')]
+    hashed = f'{stem}.{hashlib.md5(body).hexdigest()[:12]}.json'
+    path = os.path.join(root, hashed)
+    if not os.path.exists(path):
+        _write_atomic(path, body)
+        compressor.compress(path)  # .gz / .br next to it, picked up by WhiteNoise
+    return hashed
+
+
+@contextmanager
+def _publish_lock(root):
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, '.lock'), 'w') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def read_manifest(root=None):
+    try:
+        with open(os.path.join(root or get_root(), MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'files': {}}
+
+
+def publish(models=(Service, JobOpening, Post)):
+    """Render the snapshots for ``models`` and update the manifest; return the manifest."""
+    root = get_root()
+    compressor = Compressor(quiet=True)
+    with _publish_lock(root):
+        manifest = read_manifest(root)
+        prefixes = _sections(models)
+        files = {name: hashed for name, hashed in manifest['files'].items() if not name.startswith(tuple(prefixes))}
+        for name, data in render_payloads(models):
+            files[name] = _write_snapshot(root, name, data, compressor)
+        manifest = {'generated_at': timezone.now().isoformat(), 'files': dict(sorted(files.items()))}
+        _write_atomic(os.path.join(root, MANIFEST_NAME), json.dumps(manifest, indent=1).encode())
+        prune(root, manifest)
+    return manifest
+
+
+def prune(root, manifest):
+    """Delete hashed files the manifest no longer lists, once they are older than ``SNAPSHOT_RETENTION``.
+
+    Superseded files are kept for a while so clients holding the previous
+    manifest can still fetch what it points to.
+    """
+    keep = set(manifest['files'].values())
+    cutoff = time.time() - getattr(settings, 'SNAPSHOT_RETENTION', 60 * 60 * 24)
+    removed = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            base = name[:-3] if name.endswith(('.gz', '.br')) else name
+            if not HASHED_NAME_RE.search(base) or base in keep:
+                continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def publish_on_commit(model):
+    """Republish ``model``'s snapshots; failures are logged and never break the save."""
+    try:
+        publish((model,))
+    except Exception as e:
+        print(f"[Snapshots] Error publishing {model.__name__}: {e}")
+
+
+class SnapshotMiddleware(WhiteNoiseMiddleware):
+    """Serve ``SNAPSHOT_ROOT`` at ``SNAPSHOT_URL``.
+
+    Files are looked up on each request (snapshots change while the process
+    runs). Hashed names are ``immutable``; the manifest is always revalidated.
+    """
+
+    def __init__(self, get_response=None, settings=settings):
+        self.get_response = get_response
+        WhiteNoise.__init__(self, application=None, autorefresh=True, max_age=0)
+        self.use_finders = False
+        self.static_prefix = get_url()
+        self.add_files(get_root(), prefix=self.static_prefix)
+
+    def __call__(self, request):
+        if not request.path_info.startswith(self.static_prefix):
+            return self.get_response(request)
+        return super().__call__(request)
+
+    def immutable_file_test(self, path, url):
+        return bool(HASHED_NAME_RE.search(url))
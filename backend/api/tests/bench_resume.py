@@ -0,0 +1,53 @@
+"""
+Benchmark for resume field extraction.
+
+Times the precompiled single-pass extractor against the original
+implementation on the synthetic corpus. Run from ``backend/``::
+
+    python -m api.tests.bench_resume [--repeat 5] [--number 200]
+"""
+import argparse
+import os
+import statistics
+import timeit
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from api.resume import extract_fields  # noqa: E402
+from api.tests.resume_corpus import RESUME_TEXTS, legacy_extract_fields, random_corpus  # noqa: E402
+
+
+def bench(func, texts, repeat, number):
+    """Best and median microseconds per text over ``repeat`` runs."""
+    timings = timeit.repeat(lambda: [func(t) for t in texts], repeat=repeat, number=number)
+    per_text = [t / (number * len(texts)) * 1e6 for t in timings]
+    return min(per_text), statistics.median(per_text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    corpora = {
+        'golden': list(RESUME_TEXTS.values()),
+        'random': random_corpus(500),
+    }
+    for label, texts in corpora.items():
+        mismatches = sum(extract_fields(t) != legacy_extract_fields(t) for t in texts)
+        number = max(1, args.number * len(corpora['golden']) // len(texts))
+        old_best, old_median = bench(legacy_extract_fields, texts, args.repeat, number)
+        new_best, new_median = bench(extract_fields, texts, args.repeat, number)
+        print(f"{label} corpus ({len(texts)} texts, {mismatches} mismatches)")
+        print(f"  legacy  best {old_best:8.2f} us  median {old_median:8.2f} us")
+        print(f"  current best {new_best:8.2f} us  median {new_median:8.2f} us")
+        print(f"  speedup {old_median / new_median:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
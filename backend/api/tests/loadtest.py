@@ -0,0 +1,355 @@
+"""
+Load generator for the API.
+
+It drives the ASGI application in-process against a seeded test database,
+or a running server over HTTP (uvicorn, gunicorn, runserver). Run from
+``backend/``::
+
+    python -m api.tests.loadtest [--concurrency 20] [--requests 2000 | --duration 30]
+                                 [--mix posts=90,parse_resume=5,contact=5]
+    python -m api.tests.loadtest --url http://127.0.0.1:8000 --duration 60 --json run.json
+
+In-process runs create a throwaway test database (the configured backend
+with Django's ``test_`` prefix), seed it with the volumes from
+``api/tests/utils.py`` and switch the throttles off, so every request
+reaches the view. On SQLite that database is a temporary file in WAL mode
+rather than Django's shared in-memory one, where concurrent writes fail with
+"database table is locked". Over HTTP the server keeps its own
+configuration, and 429 answers are reported as throttled rather than as
+errors.
+
+The report gives throughput, latency percentiles and the status breakdown
+per request kind and overall. ``--json`` saves it for comparing worker
+models, cache backends (``CACHE_URL``) and databases (``DATABASE_URL``).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from api.tests.utils import VOLUMES, isolated_settings, resume_pdf, seed  # noqa: E402
+
+DEFAULT_MIX = 'posts=90,parse_resume=5,contact=5'
+
+
+# ─── Requests ───
+
+def multipart(fields, files):
+    """``(content_type, body)`` for a multipart/form-data upload."""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, content_type, data) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'.encode() + data + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return f'multipart/form-data; boundary={boundary}', b''.join(parts)
+
+
+class RequestFactory:
+    """Builds ``(method, path, headers, body)`` for each request kind of the mix."""
+
+    def __init__(self, rng, pdf_variants):
+        self.rng = rng
+        # A few distinct CVs, so the resume cache sees both hits and misses.
+        self.pdfs = [resume_pdf(f'Applicant {i}') for i in range(pdf_variants)]
+        published = [i for i in range(VOLUMES['posts']) if i % 6 != 0]  # see utils.seed()
+        self.slugs = [f'post-{i}' for i in published]
+
+    def build(self, kind):
+        return getattr(self, kind)()
+
+    def _get(self, path):
+        return 'GET', path, {}, b''
+
+    def posts(self):
+        return self._get('/api/posts/')
+
+    def post_detail(self):
+        return self._get(f'/api/posts/{self.rng.choice(self.slugs)}/')
+
+    def services(self):
+        return self._get('/api/services/')
+
+    def jobs(self):
+        return self._get('/api/jobs/')
+
+    def bootstrap(self):
+        return self._get('/api/bootstrap/')
+
+    def search(self):
+        return self._get(f'/api/search/posts/?q=topic+{self.rng.randrange(VOLUMES["posts"])}')
+
+    def parse_resume(self):
+        content_type, body = multipart({}, {'cv': ('cv.pdf', 'application/pdf', self.rng.choice(self.pdfs))})
+        return 'POST', '/api/parse-resume/', {'content-type': content_type}, body
+
+    def contact(self):
+        body = json.dumps({'name': 'Load Test', 'email': 'load@example.com', 'message': 'Hello from the load test.'})
+        return 'POST', '/api/contact/', {'content-type': 'application/json'}, body.encode()
+
+    def apply(self):
+        content_type, body = multipart(
+            {'name': 'Load Test', 'email': 'load@example.com', 'phone': '9876543210',
+             'job_title': 'Engineer 1', 'experience': '4 years'},
+            {'cv': ('cv.pdf', 'application/pdf', self.rng.choice(self.pdfs))},
+        )
+        return 'POST', '/api/apply/', {'content-type': content_type}, body
+
+
+def parse_mix(spec):
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if not callable(getattr(RequestFactory, name, None)) or name.startswith('_') or name == 'build':
+            raise SystemExit(f"Unknown request kind: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+# ─── Transports ───
+
+class ASGITransport:
+    """Calls the ASGI application directly, one HTTP scope per request."""
+
+    def __init__(self):
+        from core.asgi import application
+        self.app = application
+
+    async def __call__(self, method, path, headers, body, client_ip):
+        path, _, query = path.partition('?')
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+            'method': method, 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+            'query_string': query.encode(), 'root_path': '',
+            'headers': [(b'host', b'localhost')] + [(k.encode(), v.encode()) for k, v in headers.items()]
+                       + [(b'content-length', str(len(body)).encode())],
+            'client': (client_ip, 40000), 'server': ('localhost', 80),
+        }
+        done = asyncio.Event()
+        sent_body = False
+        status = None
+
+        async def receive():
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await done.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body' and not message.get('more_body'):
+                done.set()
+
+        await self.app(scope, receive, send)
+        done.set()
+        return status
+
+    def close(self):
+        pass
+
+
+class HTTPTransport:
+    """Sends requests to a running server, one pooled session per worker thread."""
+
+    def __init__(self, base_url, concurrency):
+        import requests
+        import threading
+
+        self.base_url = base_url.rstrip('/')
+        self.local = threading.local()
+        self.requests = requests
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def _send(self, method, path, headers, body):
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = self.local.session = self.requests.Session()
+        response = session.request(method, self.base_url + path, headers=headers, data=body, timeout=60)
+        return response.status_code
+
+    async def __call__(self, method, path, headers, body, client_ip):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._send, method, path, headers, body)
+
+    def close(self):
+        self.executor.shutdown()
+
+
+# ─── Run and report ───
+
+async def run(transport, factory, mix, concurrency, total, duration, rng):
+    kinds, weights = list(mix), list(mix.values())
+    results = []  # (kind, status or None, seconds)
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker():
+        nonlocal issued
+        while (total is None or issued < total) and (deadline is None or time.perf_counter() < deadline):
+            issued += 1
+            kind = rng.choices(kinds, weights)[0]
+            method, path, headers, body = factory.build(kind)
+            client_ip = f'10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}'
+            start = time.perf_counter()
+            try:
+                status = await transport(method, path, headers, body, client_ip)
+            except Exception as e:
+                status = None
+                print(f"[Load] {kind}: {type(e).__name__}: {e}")
+            results.append((kind, status, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results, time.perf_counter() - start
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))] if ordered else 0.0
+
+
+def summarize(rows, elapsed):
+    latencies = [seconds * 1000 for _, _, seconds in rows]
+    statuses = [status for _, status, _ in rows]
+    ok = sum(1 for s in statuses if s is not None and s < 400)
+    throttled = statuses.count(429)
+    errors = sum(1 for s in statuses if s is None or s >= 500)
+    return {
+        'requests': len(rows),
+        'throughput_rps': round(len(rows) / elapsed, 2) if elapsed else 0.0,
+        'ok': ok,
+        'client_errors': len(rows) - ok - throttled - errors,
+        'throttled': throttled,
+        'errors': errors,
+        'error_rate': round(errors / len(rows), 4) if rows else 0.0,
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies), 2) if latencies else 0.0,
+            **{f'p{p}': round(percentile(latencies, p / 100), 2) for p in (50, 90, 95, 99)},
+            'max': round(max(latencies), 2) if latencies else 0.0,
+        },
+    }
+
+
+def report(results, elapsed, args):
+    by_kind = {}
+    for row in results:
+        by_kind.setdefault(row[0], []).append(row)
+    summary = {
+        'target': args.url or 'in-process ASGI',
+        'concurrency': args.concurrency,
+        'mix': args.mix,
+        'elapsed_s': round(elapsed, 2),
+        'total': summarize(results, elapsed),
+        'by_kind': {kind: summarize(rows, elapsed) for kind, rows in sorted(by_kind.items())},
+    }
+
+    header = f"{'kind':<14}{'reqs':>7}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'4xx':>6}{'429':>6}{'err':>6}"
+    print(f"\n{summary['target']}, concurrency {args.concurrency}, {elapsed:.1f}s")
+    print(header)
+    print('-' * len(header))
+    for kind, s in [*summary['by_kind'].items(), ('TOTAL', summary['total'])]:
+        lat = s['latency_ms']
+        print(f"{kind:<14}{s['requests']:>7}{s['throughput_rps']:>9.1f}{lat['p50']:>9.1f}{lat['p95']:>9.1f}"
+              f"{lat['p99']:>9.1f}{lat['max']:>9.1f}{s['client_errors']:>6}{s['throttled']:>6}{s['errors']:>6}")
+    print("latency in ms")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Saved {args.json}")
+    return summary
+
+
+def use_sqlite_file(directory):
+    """Put SQLite test databases in ``directory``, in WAL mode with writers queueing.
+
+    WAL lets reads run beside the one writer; IMMEDIATE transactions take the
+    write lock up front, so a busy writer waits (up to ``timeout`` seconds)
+    instead of failing halfway through a transaction.
+    """
+    from django.db import connections
+
+    for alias in connections:
+        settings_dict = connections[alias].settings_dict
+        if settings_dict['ENGINE'] != 'django.db.backends.sqlite3':
+            continue
+        settings_dict['TEST']['NAME'] = os.path.join(directory, f'test_{alias}.sqlite3')
+        settings_dict['OPTIONS'].update({
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL',
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 30,
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help="Base URL of a running server; default drives the ASGI app in-process.")
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=None, help="Total requests (default 2000 unless --duration).")
+    parser.add_argument('--duration', type=float, default=None, help="Run for this many seconds instead.")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f"kind=weight,... (default {DEFAULT_MIX}).")
+    parser.add_argument('--pdf-variants', type=int, default=20, help="Distinct CVs sent by parse_resume/apply.")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for a reproducible request sequence.")
+    parser.add_argument('--json', help="Write the report to this file.")
+    args = parser.parse_args()
+
+    total = args.requests if args.requests or args.duration else 2000
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    factory = RequestFactory(rng, args.pdf_variants)
+
+    if args.url:
+        transport = HTTPTransport(args.url, args.concurrency)
+        try:
+            results, elapsed = asyncio.run(run(transport, factory, mix, args.concurrency, total, args.duration, rng))
+        finally:
+            transport.close()
+        report(results, elapsed, args)
+        return
+
+    from django.conf import settings
+    from django.test.runner import DiscoverRunner
+    from django.test.utils import override_settings, setup_test_environment
+
+    setup_test_environment()
+    db_dir = tempfile.mkdtemp(prefix='giggs-loadtest-')
+    use_sqlite_file(db_dir)
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    old_config = runner.setup_databases()
+    no_throttle = override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}})
+    try:
+        with isolated_settings, no_throttle:
+            from api import search
+            seed()
+            search.rebuild_index()
+            transport = ASGITransport()
+            results, elapsed = asyncio.run(run(transport, factory, mix, args.concurrency, total, args.duration, rng))
+            report(results, elapsed, args)
+    finally:
+        runner.teardown_databases(old_config)
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
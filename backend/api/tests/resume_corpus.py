@@ -0,0 +1,320 @@
+"""
+Synthetic resume texts for the field extractor in ``api/resume.py``.
+
+``EXPECTED_FIELDS`` is the golden output for each text. ``legacy_extract_fields``
+is the original multi-pass implementation, kept so the tests can prove the
+precompiled extractor returns identical results and the benchmark can measure
+the difference.
+"""
+import random
+import re
+
+RESUME_TEXTS = {
+    'indian_pin': (
+        "Priya Sharma\n"
+        "priya.sharma@example.com | +91-98765 43210\n"
+        "House No. 12, Sector 15, Noida, Uttar Pradesh 201301\n"
+        "linkedin.com/in/priya-sharma\n"
+        "Summary\n"
+        "Backend engineer with 6+ years of experience in Django and PostgreSQL.\n"
+    ),
+    'us_zip_plus_four': (
+        "JOHN A. DOE\n"
+        "1200 Market Street, San Francisco, CA 94103-1234\n"
+        "john.doe@mail.example.org\n"
+        "(415) 555-0182\n"
+        "https://www.linkedin.com/in/johndoe/\n"
+        "Experience: 12 yrs building distributed systems\n"
+    ),
+    'header_before_name': (
+        "CURRICULUM VITAE\n"
+        "Rahul Verma\n"
+        "Email: rahul@example.in\n"
+        "Mobile 9876543210\n"
+        "Address: Flat 4B, Lokhandwala Complex, Andheri West, Mumbai\n"
+        "Total Exp: 3 years\n"
+    ),
+    'keyword_only_address': (
+        "Ananya Iyer\n"
+        "ananya.iyer@example.com\n"
+        "Plot 7, Anna Nagar, Chennai\n"
+        "B.Tech, Computer Science\n"
+        "2 yrs exp in data engineering\n"
+    ),
+    'no_address_no_experience': (
+        "Mei Lin\n"
+        "mei.lin@example.com\n"
+        "Skills: Python, Go, Kubernetes\n"
+        "Education: MSc Computer Science\n"
+    ),
+    'name_with_digits_skipped': (
+        "Resume 2024\n"
+        "ID 1234567\n"
+        "Arjun Mehta\n"
+        "arjun@example.com\n"
+        "Whitefield Road, Bangalore, Karnataka 560066\n"
+        "Experience 8+ years\n"
+    ),
+    'address_line_with_email_skipped': (
+        "Sara Khan\n"
+        "sara@example.com, Gurgaon office\n"
+        "http://portfolio.example.com/delhi\n"
+        "DLF Phase 3, Gurugram, Haryana\n"
+        "10 years experience\n"
+    ),
+    'crlf_line_endings': (
+        "Vikram Singh\r\n"
+        "vikram.singh@example.com\r\n"
+        "+1 212 555 0147\r\n"
+        "45 Park Lane, Kolkata 700016\r\n"
+        "4 Years of Experience\r\n"
+    ),
+    'long_address_truncated': (
+        "Neha Gupta\n"
+        "neha@example.com\n"
+        "Address " + "Tower 5, Block C, Some Very Long Apartment Complex Name, " * 8 + "Pune 411001\n"
+    ),
+    'name_too_long_or_symbols': (
+        "Senior Software Engineer & Team Lead (Payments, Risk and Fraud Platforms)\n"
+        "Ravi_Kumar\n"
+        "ravi@example.com\n"
+        "State Highway 17, Rajasthan\n"
+    ),
+    'section_header_taken_as_name': (
+        "Profile\n"
+        "Contact\n"
+        "email: x@example.com\n"
+        "phone: 0123456789\n"
+        "http://example.com\n"
+        "Deepak Nair\n"
+        "Kochi, Kerala 682001\n"
+    ),
+    'uppercase_keywords_and_unicode': (
+        "José Álvarez\n"
+        "Lucía Fernández\n"
+        "jose@example.es\n"
+        "CALLE MAYOR 5, MADRID\n"
+        "STREET ADDRESS: 22 Baker Street\n"
+        "EXPERIENCE - 15 YEARS\n"
+    ),
+    'empty': "",
+    'blank_lines_only': "\n   \n\t\n",
+}
+
+
+EXPECTED_FIELDS = {'indian_pin': {'name': 'Priya Sharma',
+                'email': 'priya.sharma@example.com',
+                'phone': '',
+                'linkedin': 'https://linkedin.com/in/priya-sharma',
+                'qualification': '',
+                'experience': '6 years',
+                'address': 'House No. 12, Sector 15, Noida, Uttar Pradesh 201301'},
+ 'us_zip_plus_four': {'name': 'JOHN A. DOE',
+                      'email': 'john.doe@mail.example.org',
+                      'phone': '(415) 555-0182',
+                      'linkedin': 'https://www.linkedin.com/in/johndoe/',
+                      'qualification': '',
+                      'experience': '12 years',
+                      'address': '1200 Market Street, San Francisco, CA 94103-1234'},
+ 'header_before_name': {'name': 'CURRICULUM VITAE',
+                        'email': 'rahul@example.in',
+                        'phone': '9876543210',
+                        'linkedin': '',
+                        'qualification': '',
+                        'experience': '3 years',
+                        'address': 'Address: Flat 4B, Lokhandwala Complex, Andheri West, Mumbai'},
+ 'keyword_only_address': {'name': 'Ananya Iyer',
+                          'email': 'ananya.iyer@example.com',
+                          'phone': '',
+                          'linkedin': '',
+                          'qualification': '',
+                          'experience': '2 years',
+                          'address': 'Plot 7, Anna Nagar, Chennai'},
+ 'no_address_no_experience': {'name': 'Mei Lin',
+                              'email': 'mei.lin@example.com',
+                              'phone': '',
+                              'linkedin': '',
+                              'qualification': '',
+                              'experience': '',
+                              'address': ''},
+ 'name_with_digits_skipped': {'name': 'Arjun Mehta',
+                              'email': 'arjun@example.com',
+                              'phone': '',
+                              'linkedin': '',
+                              'qualification': '',
+                              'experience': '8 years',
+                              'address': 'Whitefield Road, Bangalore, Karnataka 560066'},
+ 'address_line_with_email_skipped': {'name': 'Sara Khan',
+                                     'email': 'sara@example.com',
+                                     'phone': '',
+                                     'linkedin': '',
+                                     'qualification': '',
+                                     'experience': '10 years',
+                                     'address': 'DLF Phase 3, Gurugram, Haryana'},
+ 'crlf_line_endings': {'name': 'Vikram Singh',
+                       'email': 'vikram.singh@example.com',
+                       'phone': '+1 212 555 0147',
+                       'linkedin': '',
+                       'qualification': '',
+                       'experience': '4 years',
+                       'address': '45 Park Lane, Kolkata 700016'},
+ 'long_address_truncated': {'name': 'Neha Gupta',
+                            'email': 'neha@example.com',
+                            'phone': '',
+                            'linkedin': '',
+                            'qualification': '',
+                            'experience': '',
+                            'address': 'Address Tower 5, Block C, Some Very Long Apartment Complex '
+                                       'Name, Tower 5, Block C, Some Very Long Apartment Complex '
+                                       'Name, Tower 5, Block C, Some Very Long Apartment Complex '
+                                       'Name, Tower 5, Block C, Some Very Long Apartment Complex '
+                                       'Name, Tower 5, Block C, Some Very Long Apartment Complex '
+                                       'Name, Tower 5'},
+ 'name_too_long_or_symbols': {'name': '',
+                              'email': 'ravi@example.com',
+                              'phone': '',
+                              'linkedin': '',
+                              'qualification': '',
+                              'experience': '',
+                              'address': 'State Highway 17, Rajasthan'},
+ 'section_header_taken_as_name': {'name': 'Profile',
+                                  'email': 'x@example.com',
+                                  'phone': '0123456789',
+                                  'linkedin': '',
+                                  'qualification': '',
+                                  'experience': '',
+                                  'address': 'Kochi, Kerala 682001'},
+ 'uppercase_keywords_and_unicode': {'name': '',
+                                    'email': 'jose@example.es',
+                                    'phone': '',
+                                    'linkedin': '',
+                                    'qualification': '',
+                                    'experience': '15 years',
+                                    'address': 'STREET ADDRESS: 22 Baker Street'},
+ 'empty': {'name': '',
+           'email': '',
+           'phone': '',
+           'linkedin': '',
+           'qualification': '',
+           'experience': '',
+           'address': ''},
+ 'blank_lines_only': {'name': '',
+                      'email': '',
+                      'phone': '',
+                      'linkedin': '',
+                      'qualification': '',
+                      'experience': '',
+                      'address': ''}}
+
+
+def legacy_extract_fields(text):
+    """The pre-rewrite extractor, kept verbatim as the reference for equivalence."""
+    data = {
+        'name': '',
+        'email': '',
+        'phone': '',
+        'linkedin': '',
+        'qualification': '',
+        'experience': '',
+        'address': '',
+    }
+
+    # Email
+    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    if email_match:
+        data['email'] = email_match.group()
+
+    # Phone (Indian & international formats)
+    phone_match = re.search(r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3,5}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}', text)
+    if phone_match:
+        data['phone'] = phone_match.group().strip()
+
+    # LinkedIn
+    linkedin_match = re.search(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[a-zA-Z0-9_-]+/?', text, re.IGNORECASE)
+    if linkedin_match:
+        url = linkedin_match.group()
+        if not url.startswith('http'):
+            url = 'https://' + url
+        data['linkedin'] = url
+
+    # Name — first non-empty line that is not an email/phone/url
+    lines = [l.strip() for l in text.split('\n') if l.strip()]
+    for line in lines[:5]:  # check first 5 lines
+        if '@' in line or re.search(r'\d{5,}', line) or 'linkedin' in line.lower() or 'http' in line.lower():
+            continue
+        # likely the name if it's short and mostly alphabetical
+        if len(line) < 60 and re.match(r'^[A-Za-z\s.\'-]+$', line):
+            data['name'] = line.strip()
+            break
+
+    # Address — look for lines with PIN/ZIP codes or address keywords
+    address_patterns = [
+        # Line containing a 6-digit Indian PIN code
+        r'.*\b\d{6}\b.*',
+        # Line containing a 5-digit US ZIP code
+        r'.*\b\d{5}(?:-\d{4})?\b.*',
+    ]
+    address_keywords = ['address', 'city', 'state', 'district', 'nagar', 'colony',
+                        'street', 'road', 'lane', 'sector', 'block', 'plot',
+                        'apartment', 'flat', 'floor', 'tower', 'phase',
+                        'delhi', 'mumbai', 'bangalore', 'hyderabad', 'chennai',
+                        'kolkata', 'pune', 'noida', 'gurgaon', 'gurugram',
+                        'india', 'maharashtra', 'karnataka', 'tamil nadu',
+                        'uttar pradesh', 'haryana', 'rajasthan', 'kerala']
+
+    for line in lines:
+        line_lower = line.lower()
+        # Skip lines that are clearly not addresses
+        if '@' in line or 'linkedin' in line_lower or 'http' in line_lower:
+            continue
+        # Check for PIN/ZIP code patterns
+        for pat in address_patterns:
+            if re.match(pat, line):
+                data['address'] = line.strip()[:300]
+                break
+        if data['address']:
+            break
+        # Check for address keywords
+        if any(kw in line_lower for kw in address_keywords):
+            data['address'] = line.strip()[:300]
+            break
+
+    # Experience
+    exp_patterns = [
+        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)?',
+        r'(?:experience|exp)[\s:]*(\d+)\+?\s*(?:years?|yrs?)',
+    ]
+    for pat in exp_patterns:
+        exp_match = re.search(pat, text, re.IGNORECASE)
+        if exp_match:
+            years = exp_match.group(1)
+            data['experience'] = f'{years} years'
+            break
+
+    return data
+
+
+# Building blocks for randomized texts that exercise every branch above.
+_FRAGMENTS = [
+    'Priya Sharma', 'JOHN DOE', "D'Souza-Lee", 'Ravi_Kumar', 'Resume', 'Profile',
+    'jane@example.com', 'Email: x@y.io', 'linkedin.com/in/jane-doe', 'https://LinkedIn.com/in/ab_c/',
+    'http://portfolio.example.com', '+91-98765 43210', '(415) 555-0182', '9876543210',
+    'Noida 201301', 'CA 94103-1234', 'Zip 123456789', 'Sector 62', 'Tamil Nadu', 'MG Road',
+    'flat 9', 'Floor 3, Tower B', 'DELHI', 'Statement of purpose', 'city centre',
+    '5 years', '7+ yrs of experience', 'Experience: 3 yrs', 'exp 12 years', '2 YEARS', '10yr',
+    'Skills: Python, SQL', 'B.Tech 2019', '', '   ', '\t', 'José', '12345', '1234',
+]
+
+
+def random_resume_text(rng):
+    """A random, resume-shaped text drawn from ``_FRAGMENTS``."""
+    lines = []
+    for _ in range(rng.randint(0, 14)):
+        parts = rng.sample(_FRAGMENTS, rng.randint(1, 3))
+        lines.append(rng.choice([' ', ', ', ' | ']).join(parts))
+    return rng.choice(['\n', '\r\n']).join(lines)
+
+
+def random_corpus(size, seed=20240601):
+    rng = random.Random(seed)
+    return [random_resume_text(rng) for _ in range(size)]
@@ -0,0 +1,39 @@
+from django.core.cache import caches
+from rest_framework.test import APITestCase
+
+from api.models import Post
+
+from .utils import isolated_settings
+
+
+@isolated_settings
+class ConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.post = Post.objects.create(title='Hello', slug='hello', content='Body')
+
+    def setUp(self):
+        caches['default'].clear()
+
+    def test_detail_revalidation(self):
+        response = self.client.get('/api/posts/hello/')
+        self.assertEqual(response.status_code, 200)
+        etag, last_modified = response['ETag'], response['Last-Modified']
+
+        self.assertEqual(self.client.get('/api/posts/hello/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get('/api/posts/hello/', HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        self.post.title = 'Hello again'
+        self.post.save()
+        response = self.client.get('/api/posts/hello/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_has_no_last_modified(self):
+        Post.objects.create(title='Other', slug='other', content='Body')
+        response = self.client.get('/api/posts/')
+        self.assertNotIn('Last-Modified', response)
+        etag = response['ETag']
+
+        self.post.delete()  # not the newest row: Max(updated_at) stays, the count changes
+        self.assertEqual(self.client.get('/api/posts/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from api.models import JobApplication
+
+from .utils import isolated_settings
+
+
+@isolated_settings
+class ApplicationFilterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        for day, years in ((1, 2), (15, 5), (31, None)):
+            application = JobApplication.objects.create(
+                name=f'Applicant {day}', email='a@example.com', phone='1', job_title='Engineer',
+                experience_years=years, cv='cvs/a.pdf',
+            )
+            application.created_at = datetime(2026, 3, day, 18, tzinfo=timezone.utc)
+            application.save(update_fields=['created_at'])
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def get(self, query):
+        return self.client.get(f'/api/applications/?{query}')
+
+    def names(self, query):
+        return sorted(row['name'] for row in self.get(query).json()['results'])
+
+    def test_date_range(self):
+        self.assertEqual(self.names('created_after=2026-03-10&created_before=2026-03-31'),
+                         ['Applicant 15', 'Applicant 31'])  # a bare date covers the whole day
+        self.assertEqual(self.names('created_before=2026-03-15T12:00:00Z'), ['Applicant 1'])
+        self.assertEqual(self.names('experience_min=3'), ['Applicant 15'])
+
+    def test_invalid_values(self):
+        cases = {
+            'created_after=yesterday': 'created_after',
+            'created_before=2026-02-30': 'created_before',
+            'created_after=2026-13-01T00:00': 'created_after',
+            'experience_min=two': 'experience_min',
+            'experience_max=-1': 'experience_max',
+        }
+        for query, field in cases.items():
+            with self.subTest(query=query):
+                response = self.get(query)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(field, response.json())
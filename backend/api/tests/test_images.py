@@ -0,0 +1,46 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from api.models import Post
+
+from .utils import isolated_settings
+
+
+def png(width=400, height=200):
+    buf = io.BytesIO()
+    Image.new('RGB', (width, height), 'teal').save(buf, 'PNG')
+    return SimpleUploadedFile('cover.png', buf.getvalue(), content_type='image/png')
+
+
+@isolated_settings
+class ImageVariantTests(APITestCase):
+    def setUp(self):
+        self.post = Post.objects.create(title='Hello', slug='hello', content='Body', image=png())
+        # As if the post predates the pipeline: no width, no variants.
+        self.stale = timezone.now() - timedelta(days=1)
+        Post.objects.filter(pk=self.post.pk).update(image_width=None, updated_at=self.stale)
+
+    def url(self, width=320, fmt='webp'):
+        return reverse('api-post-image-variant', kwargs={'pk': self.post.pk, 'width': width, 'fmt': fmt})
+
+    def test_lazy_variant_records_width_and_bumps_updated_at(self):
+        response = self.client.get(self.url())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/webp')
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.image_width, 400)
+        self.assertGreater(self.post.updated_at, self.stale)  # the detail ETag changes with the srcsets
+
+    def test_decompression_bomb_is_not_found(self):
+        with mock.patch.object(Image, 'MAX_IMAGE_PIXELS', 1000):
+            response = self.client.get(self.url())
+        self.assertEqual(response.status_code, 404)
+        self.post.refresh_from_db()
+        self.assertIsNone(self.post.image_width)
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest import mock
+
+from django.core import mail
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from api.mail import queue_email, send_outbox_batch
+from api.models import OutboundEmail
+
+from .utils import isolated_settings
+
+FAILING_SEND = mock.patch(
+    'django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=SMTPException('421 try later'),
+)
+
+
+@isolated_settings
+@override_settings(EMAIL_OUTBOX_BACKOFF=30, EMAIL_OUTBOX_BACKOFF_MAX=100, EMAIL_OUTBOX_MAX_ATTEMPTS=3)
+class OutboxTests(TestCase):
+    def make_due(self, outbound):
+        OutboundEmail.objects.filter(pk=outbound.pk).update(next_attempt_at=timezone.now())
+
+    def test_sends_and_marks_sent(self):
+        outbound = queue_email('Hello', '<p>Hi</p>')
+        self.assertEqual(send_outbox_batch(), (1, 0))
+        outbound.refresh_from_db()
+        self.assertEqual(outbound.status, OutboundEmail.STATUS_SENT)
+        self.assertEqual(mail.outbox[0].subject, 'Hello')
+        self.assertEqual(send_outbox_batch(), (0, 0))
+
+    def test_retry_backoff_and_dead_letter(self):
+        outbound = queue_email('Hello', '<p>Hi</p>')
+        expected_delays = [30, 60, None]  # doubled per attempt, then dead-lettered
+        with FAILING_SEND:
+            for attempt, delay in enumerate(expected_delays, start=1):
+                before = timezone.now()
+                self.assertEqual(send_outbox_batch(), (0, 1))
+                outbound.refresh_from_db()
+                self.assertEqual(outbound.attempts, attempt)
+                self.assertIn('421 try later', outbound.last_error)
+                if delay is None:
+                    self.assertEqual(outbound.status, OutboundEmail.STATUS_DEAD)
+                    break
+                self.assertEqual(outbound.status, OutboundEmail.STATUS_PENDING)
+                self.assertAlmostEqual(
+                    (outbound.next_attempt_at - before).total_seconds(), delay, delta=5,
+                )
+                self.assertEqual(send_outbox_batch(), (0, 0))  # not due yet
+                self.make_due(outbound)
+
+        self.make_due(outbound)
+        self.assertEqual(send_outbox_batch(), (0, 0))  # dead rows are never retried
+        self.assertEqual(mail.outbox, [])
+
+    def test_backoff_is_capped(self):
+        outbound = queue_email('Hello', '<p>Hi</p>')
+        OutboundEmail.objects.filter(pk=outbound.pk).update(attempts=1)
+        before = timezone.now()
+        with FAILING_SEND:
+            send_outbox_batch()
+        outbound.refresh_from_db()
+        self.assertLessEqual(outbound.next_attempt_at - before, timedelta(seconds=100 + 5))
+
+    def test_attachment_read_from_storage(self):
+        path = default_storage.save('cvs/test-attach.pdf', ContentFile(b'%PDF-1.4 cv'))
+        queue_email('Application', '<p>CV</p>', attachments=[
+            {'filename': 'cv.pdf', 'path': path, 'type': 'application/pdf', 'url': 'https://example.com/cv'},
+        ])
+        self.assertEqual(send_outbox_batch(), (1, 0))
+        self.assertEqual(mail.outbox[0].attachments[0][1], b'%PDF-1.4 cv')
+        self.assertNotIn('https://example.com/cv', mail.outbox[0].body)
+
+    def test_missing_attachment_is_linked(self):
+        outbound = queue_email('Application', '<p>CV</p>', attachments=[
+            {'filename': 'cv.pdf', 'path': 'cvs/not-on-this-disk.pdf', 'type': 'application/pdf',
+             'url': 'https://example.com/cv?token=abc'},
+        ])
+        self.assertEqual(send_outbox_batch(), (1, 0))
+        outbound.refresh_from_db()
+        self.assertEqual(outbound.status, OutboundEmail.STATUS_SENT)
+        self.assertEqual(mail.outbox[0].attachments, [])
+        self.assertIn('href="https://example.com/cv?token=abc"', mail.outbox[0].body)
+
+    def test_missing_attachment_without_link_is_retried(self):
+        outbound = queue_email('Application', '<p>CV</p>', attachments=[
+            {'filename': 'cv.pdf', 'path': 'cvs/not-on-this-disk.pdf', 'type': 'application/pdf'},
+        ])
+        self.assertEqual(send_outbox_batch(), (0, 1))
+        outbound.refresh_from_db()
+        self.assertEqual(outbound.status, OutboundEmail.STATUS_PENDING)
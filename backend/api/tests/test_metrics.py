@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api import metrics
+
+KEY = 'api-test\tGET\t200'
+
+
+def series(count):
+    s = metrics._empty_series()
+    s['count'] = count
+    return {KEY: s}
+
+
+class CollectTests(SimpleTestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix='giggs-test-metrics-')
+        override = override_settings(METRICS_DIR=self.dir)
+        override.enable()
+        self.addCleanup(override.disable)
+        alive = mock.patch.object(metrics, '_is_alive', lambda pid: pid != 999999)
+        alive.start()
+        self.addCleanup(alive.stop)
+
+    def write(self, filename, count):
+        with open(os.path.join(self.dir, filename), 'w') as f:
+            json.dump(series(count), f)
+
+    def count(self):
+        return metrics.collect().get(KEY, {'count': 0})['count']
+
+    def test_dead_worker_is_folded_once(self):
+        self.write('999999-1.json', 3)
+        self.write(f'{os.getpid()}-1.json', 2)  # an earlier process with this pid
+        self.write('12345-1.json', 4)  # alive
+        self.assertEqual(self.count(), 9)
+        self.assertEqual(
+            sorted(f for f in os.listdir(self.dir) if f.endswith('.json')),
+            sorted(['12345-1.json', metrics.registry.get_filename(), metrics.AGGREGATE_NAME]),
+        )
+        self.assertEqual(self.count(), 9)
+
+    def test_file_left_after_a_crash_is_not_counted_twice(self):
+        with open(os.path.join(self.dir, metrics.AGGREGATE_NAME), 'w') as f:
+            json.dump({'series': series(3), 'folded': ['999999-1.json']}, f)
+        self.write('999999-1.json', 3)
+        self.assertEqual(self.count(), 3)
+        self.assertFalse(os.path.exists(os.path.join(self.dir, '999999-1.json')))
+        with open(os.path.join(self.dir, metrics.AGGREGATE_NAME)) as f:
+            self.assertEqual(json.load(f)['folded'], ['999999-1.json'])
+        self.assertEqual(self.count(), 3)
+        with open(os.path.join(self.dir, metrics.AGGREGATE_NAME)) as f:
+            self.assertEqual(json.load(f)['folded'], [])
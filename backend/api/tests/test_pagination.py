@@ -0,0 +1,50 @@
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from api.models import ContactMessage
+
+from .utils import isolated_settings
+
+
+@isolated_settings
+class KeysetPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        ContactMessage.objects.bulk_create(
+            ContactMessage(name=f'Visitor {i}', email=f'v{i}@example.com', message='Hi') for i in range(7)
+        )
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def ids(self, response):
+        return [row['id'] for row in response.json()['results']]
+
+    def test_next_and_previous(self):
+        newest_first = list(ContactMessage.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+        first = self.client.get('/api/contacts/?page_size=3')
+        self.assertEqual(self.ids(first), newest_first[:3])
+        self.assertIsNone(first.json()['previous'])
+
+        second = self.client.get(first.json()['next'])
+        self.assertEqual(self.ids(second), newest_first[3:6])
+
+        last = self.client.get(second.json()['next'])
+        self.assertEqual(self.ids(last), newest_first[6:])
+        self.assertIsNone(last.json()['next'])
+
+        back = self.client.get(last.json()['previous'])
+        self.assertEqual(self.ids(back), newest_first[3:6])
+        back = self.client.get(back.json()['previous'])
+        self.assertEqual(self.ids(back), newest_first[:3])
+        self.assertIsNone(back.json()['previous'])
+        self.assertIsNotNone(back.json()['next'])
+
+    def test_invalid_cursor(self):
+        for cursor in ('not-base64!', 'aGVsbG8', 'MjAyNi0wMS0wMXx4fG4'):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(f'/api/contacts/?cursor={cursor}')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('cursor', response.json())
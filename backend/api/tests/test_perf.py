@@ -0,0 +1,126 @@
+"""
+Latency regression harness for the API endpoints.
+
+Every endpoint is timed against the seeded volumes and its median and p95
+are compared with ``api/tests/perf_baseline.json``. The test fails when a
+median is more than ``PERF_TOLERANCE`` times its baseline (plus
+``PERF_SLACK_MS`` for timer noise). Timings depend on the machine, so the
+suite only runs on request, and the baseline is recorded on the machine that
+runs it. A missing baseline fails the test rather than passing silently::
+
+    RUN_PERF_TESTS=1 PERF_UPDATE_BASELINE=1 python manage.py test api.tests.test_perf   # record / accept numbers
+    RUN_PERF_TESTS=1 python manage.py test api.tests.test_perf
+
+Public GETs are timed cold (response cache cleared before each request), so
+the numbers cover the queries and serialization, not a cache hit.
+"""
+import json
+import os
+import statistics
+import time
+import unittest
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APITestCase
+
+from api import search
+from api.models import Service
+
+from .utils import isolated_settings, resume_pdf, seed
+
+BASELINE_PATH = Path(__file__).with_name('perf_baseline.json')
+ITERATIONS = int(os.getenv('PERF_ITERATIONS', 30))
+WARMUP = 3
+TOLERANCE = float(os.getenv('PERF_TOLERANCE', 1.5))
+SLACK_MS = float(os.getenv('PERF_SLACK_MS', 1.0))
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+@unittest.skipUnless(os.getenv('RUN_PERF_TESTS'), "set RUN_PERF_TESTS=1 to run the latency benchmarks")
+@isolated_settings
+class EndpointLatencyTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = seed()
+        search.rebuild_index()
+
+    def setUp(self):
+        self.admin_client = self.client_class()
+        self.admin_client.force_authenticate(self.admin)
+
+    def endpoints(self):
+        """``name -> (client, method, url, kwargs factory, clear cache first)``."""
+        service_ids = list(Service.objects.values_list('id', flat=True))
+        public, admin = self.client, self.admin_client
+        return {
+            'posts': (public, 'get', '/api/posts/', dict, True),
+            'posts (cached)': (public, 'get', '/api/posts/', dict, False),
+            'post detail': (public, 'get', '/api/posts/post-1/', dict, True),
+            'services': (public, 'get', '/api/services/', dict, True),
+            'jobs': (public, 'get', '/api/jobs/', dict, True),
+            'search': (public, 'get', '/api/search/posts/?q=topic', dict, True),
+            'bootstrap': (public, 'get', '/api/bootstrap/', dict, True),
+            'contacts': (admin, 'get', '/api/contacts/', dict, False),
+            'applications': (admin, 'get', '/api/applications/', dict, False),
+            'applications export': (admin, 'get', '/api/applications/export/csv/', dict, False),
+            'admin posts': (admin, 'get', '/api/admin/posts/', dict, False),
+            'services batch': (admin, 'patch', '/api/admin/services/batch/', lambda: {
+                'data': [{'id': pk, 'order': n} for n, pk in enumerate(service_ids)], 'format': 'json',
+            }, False),
+            'parse resume': (public, 'post', '/api/parse-resume/', lambda: {
+                'data': {'cv': SimpleUploadedFile('cv.pdf', resume_pdf(), 'application/pdf')}, 'format': 'multipart',
+            }, True),
+        }
+
+    def measure(self, client, method, url, make_kwargs, cold):
+        samples = []
+        for i in range(WARMUP + ITERATIONS):
+            if cold:
+                for alias in ('default', 'resumes'):
+                    caches[alias].clear()
+            kwargs = make_kwargs()
+            start = time.perf_counter()
+            response = getattr(client, method)(url, **kwargs)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            elapsed = (time.perf_counter() - start) * 1000
+            self.assertLess(response.status_code, 400, url)
+            if i >= WARMUP:
+                samples.append(elapsed)
+        return {'median_ms': round(statistics.median(samples), 3), 'p95_ms': round(percentile(samples, 0.95), 3)}
+
+    def test_latency_against_baseline(self):
+        # The throttles would start answering 429 halfway through the iterations.
+        with self.settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}}):
+            results = {name: self.measure(*spec) for name, spec in self.endpoints().items()}
+
+        baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else None
+        print(f"\n{'endpoint':<22}{'median ms':>11}{'p95 ms':>10}{'baseline':>11}")
+        for name, result in results.items():
+            reference = (baseline or {}).get(name, {}).get('median_ms')
+            print(f"{name:<22}{result['median_ms']:>11.2f}{result['p95_ms']:>10.2f}{reference or '-':>11}")
+
+        if os.getenv('PERF_UPDATE_BASELINE'):
+            BASELINE_PATH.write_text(json.dumps(results, indent=2) + '\n')
+            print(f"Baseline written to {BASELINE_PATH}")
+            return
+        if baseline is None:
+            self.fail(f"No baseline at {BASELINE_PATH}; record one with PERF_UPDATE_BASELINE=1.")
+
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+            limit = baseline[name]['median_ms'] * TOLERANCE + SLACK_MS
+            with self.subTest(endpoint=name):
+                self.assertLessEqual(
+                    result['median_ms'], limit,
+                    f"{name}: median {result['median_ms']:.2f} ms exceeds {limit:.2f} ms "
+                    f"(baseline {baseline[name]['median_ms']:.2f} ms x {TOLERANCE})",
+                )
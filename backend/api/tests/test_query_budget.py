@@ -0,0 +1,167 @@
+"""
+Exact query budgets for every API endpoint, against seeded production volumes.
+
+A budget that fails means a change added queries (usually an N+1 in a
+serializer) or lost a cache hit. Update the number only when the new count is
+intended.
+"""
+from django.core import mail
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APITestCase
+
+from api import search
+from api.mail import send_outbox_batch
+from api.models import ContactMessage, JobApplication, Post, Service
+
+from .utils import VOLUMES, isolated_settings, resume_pdf, seed
+
+
+def consume(response):
+    """Read a (possibly streaming) response so its queries run inside the assertion."""
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+@isolated_settings
+class QueryBudgetTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = seed()
+        search.rebuild_index()
+
+    def setUp(self):
+        # Response cache, cache versions and throttle buckets start empty for every test.
+        for alias in ('default', 'resumes'):
+            caches[alias].clear()
+        self.admin_client = self.client_class()
+        self.admin_client.force_authenticate(self.admin)
+
+    def assertBudget(self, queries, method, url, client=None, status=200, **kwargs):
+        client = client or self.client
+        with self.assertNumQueries(queries):
+            response = getattr(client, method)(url, **kwargs)
+            consume(response)
+        self.assertEqual(response.status_code, status, getattr(response, 'data', None))
+        return response
+
+
+class PublicEndpointTests(QueryBudgetTestCase):
+    def test_post_list(self):
+        response = self.assertBudget(2, 'get', '/api/posts/')  # validators + list
+        self.assertEqual(len(response.json()), Post.objects.filter(is_published=True).count())
+        self.assertNotIn('content', response.json()[0])
+
+    def test_post_list_is_cached(self):
+        etag = self.assertBudget(2, 'get', '/api/posts/')['ETag']
+        self.assertBudget(0, 'get', '/api/posts/')
+        self.assertBudget(0, 'get', '/api/posts/', status=304, HTTP_IF_NONE_MATCH=etag)
+
+    def test_post_list_invalidated_by_save(self):
+        self.assertBudget(2, 'get', '/api/posts/')
+        Post.objects.get(slug='post-1').save()
+        self.assertBudget(2, 'get', '/api/posts/')
+
+    def test_post_detail(self):
+        response = self.assertBudget(2, 'get', '/api/posts/post-1/')
+        self.assertIn('content_html', response.json())
+
+    def test_services(self):
+        response = self.assertBudget(2, 'get', '/api/services/')
+        self.assertEqual(len(response.json()), VOLUMES['services'])
+
+    def test_jobs(self):
+        response = self.assertBudget(2, 'get', '/api/jobs/')
+        self.assertEqual(len(response.json()), VOLUMES['jobs'] - VOLUMES['jobs'] // 5)
+
+    def test_search(self):
+        response = self.assertBudget(2, 'get', '/api/search/posts/?q=topic')  # match + in_bulk
+        self.assertTrue(response.json())
+
+    def test_bootstrap(self):
+        response = self.assertBudget(3, 'get', '/api/bootstrap/')  # one per section
+        self.assertEqual(set(response.json()), {'services', 'jobs', 'posts'})
+        self.assertBudget(0, 'get', '/api/bootstrap/')
+
+    def test_bootstrap_single_section(self):
+        self.assertBudget(1, 'get', '/api/bootstrap/?sections=posts&posts.fields=id,title,image_variants')
+
+
+class AdminEndpointTests(QueryBudgetTestCase):
+    def test_contacts(self):
+        response = self.assertBudget(1, 'get', '/api/contacts/', client=self.admin_client)
+        self.assertEqual(len(response.json()['results']), 50)
+
+    def test_applications_every_page(self):
+        url, pages = '/api/applications/', 0
+        while url:
+            url = self.assertBudget(1, 'get', url, client=self.admin_client).json()['next']
+            pages += 1
+        self.assertEqual(pages, -(-VOLUMES['applications'] // 50))
+
+    def test_applications_filtered(self):
+        response = self.assertBudget(1, 'get', '/api/applications/?job_title=Engineer%203&experience_min=2',
+                                     client=self.admin_client)
+        results = response.json()['results']
+        expected = JobApplication.objects.filter(job_title='Engineer 3', experience_years__gte=2)
+        self.assertEqual(sorted(row['id'] for row in results), sorted(expected.values_list('id', flat=True)))
+        self.assertLess(len(results), VOLUMES['applications'] // 15)  # some Engineer 3 rows are filtered out
+
+    def test_exports(self):
+        # Rows are streamed in EXPORT_CHUNK_SIZE chunks; the seeded volume fits in one.
+        self.assertBudget(1, 'get', '/api/applications/export/csv/', client=self.admin_client)
+        self.assertBudget(1, 'get', '/api/contacts/export/ndjson/', client=self.admin_client)
+
+    def test_admin_lists(self):
+        for url in ('/api/admin/posts/', '/api/admin/services/', '/api/admin/jobs/', '/api/admin/users/'):
+            with self.subTest(url=url):
+                self.assertBudget(1, 'get', url, client=self.admin_client)
+
+    def test_admin_post_detail(self):
+        self.assertBudget(1, 'get', f'/api/admin/posts/{Post.objects.first().pk}/', client=self.admin_client)
+
+    def test_batch_reorder(self):
+        ids = list(Service.objects.order_by('order').values_list('id', flat=True))
+        changes = [{'id': pk, 'order': n} for n, pk in enumerate(reversed(ids))]
+        # savepoint + locked select + one UPDATE for all rows + release
+        response = self.assertBudget(4, 'patch', '/api/admin/services/batch/', client=self.admin_client,
+                                     data=changes, format='json')
+        self.assertEqual(response.json()['updated'], len(ids))
+
+    def test_jwt_authenticated_request(self):
+        token = self.client.post('/api/token/', {'username': 'admin', 'password': 'password'}, format='json').json()['access']
+        self.assertBudget(2, 'get', '/api/contacts/', HTTP_AUTHORIZATION=f'Bearer {token}')  # user + page
+
+    def test_metrics(self):
+        self.assertBudget(0, 'get', '/api/admin/metrics/', client=self.admin_client)
+
+
+class WriteEndpointTests(QueryBudgetTestCase):
+    def test_contact(self):
+        # savepoint + message + outbox row + release
+        self.assertBudget(4, 'post', '/api/contact/', status=201, format='json',
+                          data={'name': 'Ann', 'email': 'ann@example.com', 'message': 'Hello'})
+        self.assertEqual(ContactMessage.objects.count(), VOLUMES['contacts'] + 1)
+
+        sent, failed = send_outbox_batch()
+        self.assertEqual((sent, failed), (1, 0))
+        self.assertEqual(mail.outbox[0].to, ['hr@example.com'])
+
+    def test_parse_resume(self):
+        response = self.assertBudget(0, 'post', '/api/parse-resume/', format='multipart',
+                                     data={'cv': SimpleUploadedFile('cv.pdf', resume_pdf(), 'application/pdf')})
+        self.assertEqual(response.json()['email'], 'jane.doe@example.com')
+
+    def test_apply(self):
+        self.assertBudget(4, 'post', '/api/apply/', status=201, format='multipart', data={  # as contact
+            'name': 'Jane Doe', 'email': 'jane.doe@example.com', 'phone': '9876543210',
+            'job_title': 'Engineer 1', 'experience': '6 years',
+            'cv': SimpleUploadedFile('cv.pdf', resume_pdf(), 'application/pdf'),
+        })
+        application = JobApplication.objects.latest('id')
+        self.assertEqual(application.experience_years, 6)
+
+        send_outbox_batch()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('Jane Doe', mail.outbox[0].subject)
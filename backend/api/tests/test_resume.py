@@ -0,0 +1,31 @@
+from django.test import SimpleTestCase
+
+from api.resume import experience_years, extract_fields
+
+from .resume_corpus import EXPECTED_FIELDS, RESUME_TEXTS, legacy_extract_fields, random_corpus
+
+
+class ExtractFieldsGoldenTests(SimpleTestCase):
+    """The precompiled extractor must match the golden corpus exactly."""
+
+    def test_golden_corpus(self):
+        for name, text in RESUME_TEXTS.items():
+            with self.subTest(resume=name):
+                self.assertEqual(extract_fields(text), EXPECTED_FIELDS[name])
+
+    def test_matches_legacy_extractor_on_random_texts(self):
+        for i, text in enumerate(random_corpus(2000)):
+            with self.subTest(sample=i):
+                self.assertEqual(extract_fields(text), legacy_extract_fields(text))
+
+
+class ExperienceYearsTests(SimpleTestCase):
+    def test_values(self):
+        cases = {
+            '3 years': 3, '2+ yrs': 2, '18 months': 1, '1.5': 1, '80 years': 80, 'Fresher': None,
+            # Calendar years are not durations.
+            'Since 2019': None, 'Jan 2015 - present': None,
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(experience_years(text), expected)
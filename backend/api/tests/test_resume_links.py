@@ -0,0 +1,55 @@
+import re
+import time
+from unittest import mock
+
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from api.models import JobApplication, OutboundEmail
+
+from .utils import isolated_settings, resume_pdf
+
+
+@isolated_settings
+@override_settings(RESUME_ATTACH_MAX_SIZE=0, RESUME_LINK_MAX_AGE=60 * 60)  # always link, valid for an hour
+class ResumeDownloadLinkTests(APITestCase):
+    def setUp(self):
+        caches['default'].clear()  # throttle buckets
+        self.pdf = resume_pdf()
+        response = self.client.post('/api/apply/', {
+            'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '9876543210', 'job_title': 'Engineer',
+            'cv': SimpleUploadedFile('cv.pdf', self.pdf, 'application/pdf'),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        self.application = JobApplication.objects.get()
+        html = OutboundEmail.objects.get().html_body
+        self.url = re.search(r'href="http://testserver(/api/applications/\d+/cv/\?token=[^"]+)"', html).group(1)
+
+    def download(self, url):
+        response = self.client.get(url)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        return response.status_code, body
+
+    def test_valid_link_downloads_the_cv(self):
+        self.assertEqual(self.download(self.url), (200, self.pdf))
+
+    def test_expired_link(self):
+        later = time.time() + 60 * 60 + 1
+        with mock.patch('django.core.signing.time.time', return_value=later):
+            self.assertEqual(self.download(self.url)[0], 403)
+
+    def test_tampered_signature(self):
+        token = self.url.rsplit('token=', 1)[1]
+        tampered = token[:-1] + ('A' if token[-1] != 'A' else 'B')
+        self.assertEqual(self.download(self.url.replace(token, tampered))[0], 403)
+
+    def test_token_is_bound_to_the_application(self):
+        other = JobApplication.objects.create(name='Other', email='o@example.com', phone='1', job_title='x',
+                                              cv=self.application.cv.name)
+        url = self.url.replace(f'/applications/{self.application.pk}/', f'/applications/{other.pk}/')
+        self.assertEqual(self.download(url)[0], 403)
+
+    def test_missing_token(self):
+        self.assertEqual(self.download(self.url.split('?')[0])[0], 403)
@@ -0,0 +1,35 @@
+from django.core.cache import caches
+from rest_framework.test import APITestCase
+
+from api import search
+from api.models import Post
+
+from .utils import isolated_settings
+
+
+@isolated_settings
+class PostSearchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Post.objects.create(title='Search', slug='search', content='A post about finding things.')
+        Post.objects.create(title='Kafka pipelines', slug='kafka', excerpt='Streaming', content='Kafka and Flink.')
+        Post.objects.create(title='Draft on Kafka', slug='draft', content='Kafka', is_published=False)
+
+    def setUp(self):
+        caches['default'].clear()
+
+    def test_search(self):
+        response = self.client.get('/api/search/posts/?q=kafka')
+        self.assertEqual([hit['slug'] for hit in response.json()], ['kafka'])
+        self.assertIn('<mark>Kafka</mark>', response.json()[0]['snippet'])
+
+    def test_post_slugged_search_is_reachable(self):
+        response = self.client.get('/api/posts/search/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Search')
+
+    def test_unindexed_fallback(self):
+        # What search_posts() runs on a database without one of the indexes.
+        hits = search._search_unindexed(['kafka', 'flink'], 20, 'default')
+        self.assertEqual([pk for pk, _, _ in hits], [Post.objects.get(slug='kafka').pk])
+        self.assertIn('<mark>Flink.</mark>', hits[0][2])
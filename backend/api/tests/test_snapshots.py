@@ -0,0 +1,58 @@
+import hashlib
+import json
+import os
+import tempfile
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from api import snapshots
+from api.models import Post, Service
+
+from .utils import isolated_settings
+
+
+@isolated_settings
+class SnapshotTests(APITestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='giggs-test-snapshots-')
+        override = override_settings(SNAPSHOT_ROOT=self.root)
+        override.enable()
+        self.addCleanup(override.disable)
+        Service.objects.create(title='Cloud', tagline='Tagline', description='Description')
+        self.post = Post.objects.create(title='Hello', slug='hello', content='Body')
+
+    def read(self, hashed):
+        with open(os.path.join(self.root, hashed), 'rb') as f:
+            return f.read()
+
+    def test_manifest_and_hashed_names(self):
+        manifest = snapshots.publish()
+        self.assertEqual(set(manifest['files']), {'services.json', 'jobs.json', 'posts.json', 'posts/hello.json'})
+        self.assertEqual(snapshots.read_manifest(self.root), manifest)
+        for name, hashed in manifest['files'].items():
+            with self.subTest(name=name):
+                body = self.read(hashed)
+                self.assertEqual(hashed, f'{name[:-5]}.{hashlib.md5(body).hexdigest()[:12]}.json')
+                self.assertRegex(hashed, snapshots.HASHED_NAME_RE)
+        # The compressor drops variants that don't shrink (the empty jobs list).
+        self.assertTrue(os.path.exists(os.path.join(self.root, manifest['files']['services.json'] + '.gz')))
+        self.assertEqual(json.loads(self.read(manifest['files']['posts/hello.json']))['title'], 'Hello')
+
+        # Unchanged content keeps its name; changed content gets a new one.
+        self.post.title = 'Hello again'
+        self.post.save()
+        republished = snapshots.publish((Post,))
+        self.assertEqual(republished['files']['services.json'], manifest['files']['services.json'])
+        self.assertNotEqual(republished['files']['posts/hello.json'], manifest['files']['posts/hello.json'])
+
+    def test_served_with_cache_headers(self):
+        manifest = snapshots.publish()
+        response = self.client.get('/snapshots/manifest.json')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('immutable', response['Cache-Control'])
+
+        response = self.client.get('/snapshots/' + manifest['files']['services.json'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(b''.join(response.streaming_content), self.read(manifest['files']['services.json']))
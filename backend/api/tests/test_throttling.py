@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .utils import isolated_settings
+
+
+@isolated_settings
+@override_settings(REST_FRAMEWORK={
+    **settings.REST_FRAMEWORK,
+    'DEFAULT_THROTTLE_RATES': {'contact': '5/hour', 'contact_global': '100/hour'},
+    'NUM_PROXIES': 1,  # as on Render
+})
+class ContactThrottleTests(APITestCase):
+    def setUp(self):
+        caches['default'].clear()
+
+    def post(self, client_ip):
+        data = {'name': 'Visitor', 'email': 'visitor@example.com', 'message': 'Hello'}
+        return self.client.post(reverse('api-contact'), data, format='json', HTTP_X_FORWARDED_FOR=client_ip)
+
+    def test_bucket_empties_after_burst(self):
+        for _ in range(5):
+            self.assertEqual(self.post('203.0.113.7').status_code, 201)
+        response = self.post('203.0.113.7')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(int(response['Retry-After']), 720)  # one token per 3600 / 5 seconds
+
+    def test_buckets_are_per_forwarded_client(self):
+        for _ in range(5):
+            self.post('203.0.113.7')
+        self.assertEqual(self.post('203.0.113.7').status_code, 429)
+        self.assertEqual(self.post('198.51.100.4').status_code, 201)
@@ -0,0 +1,31 @@
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from api.models import Post
+
+from .utils import isolated_settings
+
+
+@isolated_settings
+class ServerTimingTests(APITestCase):
+    def setUp(self):
+        caches['default'].clear()
+        Post.objects.create(title='Hello', slug='hello', content='Body')
+
+    @override_settings(SERVER_TIMING=True, SERVER_TIMING_SAMPLE_RATE=1.0, SERVER_TIMING_ALLOW_ORIGIN='https://giggs.example')
+    def test_header_lists_every_phase(self):
+        response = self.client.get('/api/posts/')
+        self.assertEqual(response.status_code, 200)
+        phases = {part.split(';')[0]: part for part in response['Server-Timing'].split(', ')}
+        self.assertEqual(list(phases), ['db', 'serialize', 'render', 'total'])
+        self.assertRegex(phases['db'], r'^db;dur=\d+\.\d;desc="\d+ quer(y|ies)"$')
+        self.assertRegex(phases['total'], r'^total;dur=\d+\.\d$')
+        self.assertEqual(response['Timing-Allow-Origin'], 'https://giggs.example')
+
+    @override_settings(SERVER_TIMING=True, SERVER_TIMING_SAMPLE_RATE=0.0)
+    def test_unsampled_request_has_no_header(self):
+        self.assertNotIn('Server-Timing', self.client.get('/api/posts/'))
+
+    def test_off_by_default_in_tests(self):
+        self.assertNotIn('Server-Timing', self.client.get('/api/posts/'))
@@ -0,0 +1,93 @@
+import io
+
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.http.multipartparser import MultiPartParser
+from django.test import SimpleTestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from rest_framework.test import APITestCase
+
+from api.models import JobApplication
+from api.uploads import ResumeUploadHandler
+
+from .utils import isolated_settings, resume_pdf
+
+MAX_SIZE = 100 * 1024
+
+
+class CountingHandler(FileUploadHandler):
+    """Runs after ResumeUploadHandler and records what reaches it."""
+
+    def __init__(self):
+        super().__init__()
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+
+@override_settings(RESUME_MAX_UPLOAD_SIZE=MAX_SIZE)
+class ResumeUploadHandlerTests(SimpleTestCase):
+    def parse(self, content, name='cv.pdf'):
+        body = encode_multipart(BOUNDARY, {'cv': SimpleUploadedFile(name, content, 'application/pdf')})
+        handler, spy = ResumeUploadHandler(), CountingHandler()
+        meta = {'CONTENT_TYPE': MULTIPART_CONTENT, 'CONTENT_LENGTH': len(body)}
+        MultiPartParser(meta, io.BytesIO(body), [handler, spy]).parse()
+        return handler, spy
+
+    def test_oversize_stops_at_the_limit(self):
+        handler, spy = self.parse(b'%PDF-1.4\n' + b'0' * (10 * MAX_SIZE))
+        self.assertIn('File too large', handler.error)
+        # Chunks past the limit never reach the handlers that buffer the file.
+        self.assertLessEqual(spy.received, MAX_SIZE)
+
+    def test_non_pdf_stops_on_the_first_chunk(self):
+        handler, spy = self.parse(b'PK\x03\x04' + b'0' * (10 * MAX_SIZE), name='cv.pdf')
+        self.assertEqual(handler.error, 'Only PDF files are allowed.')
+        self.assertEqual(spy.received, 0)
+
+    def test_valid_pdf_is_hashed(self):
+        handler, spy = self.parse(resume_pdf())
+        self.assertIsNone(handler.error)
+        self.assertEqual(len(handler.digests['cv']), 64)
+        self.assertEqual(spy.received, len(resume_pdf()))
+
+
+@isolated_settings
+@override_settings(RESUME_MAX_UPLOAD_SIZE=MAX_SIZE)
+class ResumeUploadEndpointTests(APITestCase):
+    form = {'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '9876543210', 'job_title': 'Engineer'}
+
+    def setUp(self):
+        caches['default'].clear()  # throttle buckets
+
+    def apply(self, content, name='cv.pdf'):
+        return self.client.post('/api/apply/', {**self.form, 'cv': SimpleUploadedFile(name, content)}, format='multipart')
+
+    def test_oversize_upload(self):
+        response = self.apply(b'%PDF-1.4\n' + b'0' * (2 * MAX_SIZE))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('File too large', response.json()['cv'])
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_renamed_non_pdf(self):
+        response = self.apply(b'\x89PNG\r\n\x1a\n' + b'0' * 1000, name='photo.pdf')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['cv'], 'Only PDF files are allowed.')
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_valid_pdf(self):
+        response = self.apply(resume_pdf())
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(JobApplication.objects.get().cv.name.endswith('.pdf'))
+
+    def test_parse_resume_rejects_non_pdf(self):
+        response = self.client.post('/api/parse-resume/', {'cv': SimpleUploadedFile('cv.pdf', b'not a pdf')},
+                                    format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Only PDF files are allowed.')
@@ -0,0 +1,103 @@
+"""Fixtures shared by the endpoint tests: generated PDFs and seeded data."""
+import tempfile
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+
+from api.models import ContactMessage, JobApplication, JobOpening, Post, Service
+
+# Realistic production volumes for the seeded tables.
+VOLUMES = {'posts': 60, 'services': 12, 'jobs': 15, 'contacts': 300, 'applications': 300}
+
+# Keep every side effect of a request inside the test run.
+isolated_settings = override_settings(
+    EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+    EMAIL_RECEIVERS=['hr@example.com'],
+    MEDIA_ROOT=tempfile.mkdtemp(prefix='giggs-test-media-'),
+    METRICS_DIR=tempfile.mkdtemp(prefix='giggs-test-metrics-'),
+    SNAPSHOT_PUBLISH_ON_SAVE=False,
+    SERVER_TIMING=False,
+    THROTTLE_CACHE_ALIAS='default',  # cleared with the response cache between tests
+)
+
+
+def _pdf_string(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(pages):
+    """A minimal valid PDF with one page per string in ``pages`` (lines split on ``\\n``)."""
+    count = len(pages)
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(count))}] /Count {count} >>",
+    ]
+    font = 3 + 2 * count
+    for i, text in enumerate(pages):
+        lines = ' '.join(f'({_pdf_string(line)}) Tj T*' for line in text.split('\n'))
+        stream = f'BT /F1 12 Tf 14 TL 72 720 Td {lines} ET'
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R '
+            f'/Resources << /Font << /F1 {font} 0 R >> >> >>'
+        )
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+    objects.append('<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+
+    out, offsets = b'%PDF-1.4\n', []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n{body}\nendobj\n'.encode()
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    out += b''.join(f'{offset:010d} 00000 n \n'.encode() for offset in offsets)
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    return out
+
+
+def resume_pdf(name='Jane Doe'):
+    return make_pdf([
+        f'{name}\nEmail: jane.doe@example.com\nPhone: +91 98765 43210\n'
+        'Experience: 6 years in backend development\nB.Tech in Computer Science',
+        'Skills: Python, Django, PostgreSQL\nAddress: 12 MG Road, Bengaluru',
+    ])
+
+
+def seed(volumes=VOLUMES):
+    """Create the seeded rows with bulk_create and return the admin user."""
+    now = timezone.now()
+    Service.objects.bulk_create(
+        Service(title=f'Service {i}', tagline='Tagline', description='Description ' * 20,
+                highlights=['AI', 'Cloud', 'Data'], order=i)
+        for i in range(volumes['services'])
+    )
+    JobOpening.objects.bulk_create(
+        JobOpening(title=f'Engineer {i}', location='Remote', description='Role description ' * 30,
+                   is_active=i % 5 != 0)
+        for i in range(volumes['jobs'])
+    )
+    Post.objects.bulk_create(
+        Post(title=f'Post about topic {i}', slug=f'post-{i}', excerpt='Excerpt ' * 10,
+             content=f'# Heading {i}\n\n' + 'Paragraph with **markdown**. ' * 100,
+             content_html=f'<h1>Heading {i}</h1>' + '<p>Paragraph</p>' * 100,
+             order=i, is_published=i % 6 != 0)
+        for i in range(volumes['posts'])
+    )
+    ContactMessage.objects.bulk_create(
+        ContactMessage(name=f'Visitor {i}', email=f'visitor{i}@example.com', message='Hello ' * 40)
+        for i in range(volumes['contacts'])
+    )
+    JobApplication.objects.bulk_create(
+        JobApplication(name=f'Applicant {i}', email=f'applicant{i}@example.com', phone='9876543210',
+                       qualification='B.Tech', experience=f'{i % 12} years', experience_years=i % 12,
+                       job_title=f'Engineer {i % 15}', cv=f'cvs/applicant-{i}.pdf')
+        for i in range(volumes['applications'])
+    )
+    # Spread created_at so date filters and keyset pages see distinct values.
+    for model in (ContactMessage, JobApplication):
+        rows = list(model.objects.only('id'))
+        for row in rows:
+            row.created_at = now - timedelta(hours=row.pk)
+        model.objects.bulk_update(rows, ['created_at'])
+    return User.objects.create_superuser('admin', 'admin@example.com', 'password')
@@ -0,0 +1,83 @@
+"""
+Token-bucket throttling for the expensive anonymous POST endpoints.
+
+A view sets ``throttle_scope``. Each request then has to take one token from
+two buckets, both kept in the ``THROTTLE_CACHE_ALIAS`` cache, which every
+gunicorn worker shares (see core/settings.py):
+
+* ``<scope>``: one bucket per client IP
+* ``<scope>_global``: one bucket for everybody
+
+Rates come from ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`` as
+``"<tokens>/<period>"`` (e.g. ``"5/min"``). The first number is both the
+burst size and the refill over one period. A scope without a rate is not
+limited.
+
+The check runs in ``APIView.initial()``, before the request body is parsed,
+so a throttled upload never reaches the PDF parser or the mail outbox.
+Updates are read-modify-write, not atomic, so under heavy concurrency a
+bucket can hand out a few extra tokens. That is fine for abuse protection.
+"""
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 60 * 60 * 24}
+
+
+def parse_rate(rate):
+    """``"5/min"`` -> ``(capacity, tokens_per_second)``, or None."""
+    if not rate:
+        return None
+    count, _, period = rate.partition('/')
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period.strip()[0].lower()]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Per-IP and global token buckets for ``view.throttle_scope``."""
+
+    def get_cache(self):
+        return caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+
+    def get_buckets(self, request, scope):
+        rates = api_settings.DEFAULT_THROTTLE_RATES
+        buckets = {
+            f'throttle:{scope}:ip:{self.get_ident(request)}': parse_rate(rates.get(scope)),
+            f'throttle:{scope}:global': parse_rate(rates.get(f'{scope}_global')),
+        }
+        return {key: rate for key, rate in buckets.items() if rate}
+
+    def allow_request(self, request, view):
+        self.retry_after = None
+        scope = getattr(view, 'throttle_scope', None)
+        buckets = self.get_buckets(request, scope) if scope else {}
+        if not buckets:
+            return True
+
+        cache = self.get_cache()
+        now = time.time()
+        stored = cache.get_many(list(buckets))
+        levels, wait = {}, 0.0
+        for key, (capacity, per_second) in buckets.items():
+            tokens, stamp = stored.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - stamp) * per_second)
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) / per_second)
+            levels[key] = tokens
+        if wait:
+            # Nothing is taken: a client that is already blocked does not drain the global bucket.
+            self.retry_after = wait
+            return False
+
+        # A bucket left alone for this long is full again, the same as a missing key.
+        timeout = max(math.ceil(capacity / per_second) for capacity, per_second in buckets.values()) + 1
+        cache.set_many({key: (tokens - 1, now) for key, tokens in levels.items()}, timeout)
+        return True
+
+    def wait(self):
+        return self.retry_after
@@ -0,0 +1,96 @@
+"""
+Streaming checks for resume uploads.
+
+``ResumeUploadHandler`` runs ahead of Django's default upload handlers and
+sees every chunk of the ``cv`` field as it arrives. It stops the upload as
+soon as the file is larger than ``RESUME_MAX_UPLOAD_SIZE`` or does not start
+with the ``%PDF`` magic bytes, so a bad upload is never buffered to memory
+or disk, and it hashes the file on the way through.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.template.defaultfilters import filesizeformat
+
+PDF_MAGIC = b'%PDF'
+
+
+class ResumeUploadHandler(FileUploadHandler):
+    """Validate and SHA-256 the ``cv`` upload chunk by chunk."""
+    field_names = ('cv',)
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.error = None
+        self.digests = {}
+        self._active = False
+
+    @property
+    def max_size(self):
+        return getattr(settings, 'RESUME_MAX_UPLOAD_SIZE', 5 * 1024 * 1024)
+
+    def _reject(self, message):
+        self.error = message
+        # Stop parsing but still drain the body, so the client gets our 400.
+        raise StopUpload(connection_reset=False)
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self._active = field_name in self.field_names
+        if not self._active:
+            return
+        if content_length is not None and content_length > self.max_size:
+            self._reject(self.size_error())
+        self._hash = hashlib.sha256()
+        self._head = b''
+
+    def size_error(self):
+        return f'File too large. The maximum size is {filesizeformat(self.max_size)}.'
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self._active:
+            return raw_data
+        if start + len(raw_data) > self.max_size:
+            self._reject(self.size_error())
+        if len(self._head) < len(PDF_MAGIC):
+            self._head += raw_data[:len(PDF_MAGIC) - len(self._head)]
+            if not PDF_MAGIC.startswith(self._head):
+                self._reject('Only PDF files are allowed.')
+        self._hash.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self._active:
+            if self._head != PDF_MAGIC:
+                self._reject('Only PDF files are allowed.')
+            self.digests[self.field_name] = self._hash.hexdigest()
+            self._active = False
+        return None  # the next handler builds the UploadedFile
+
+
+def _handler(request):
+    for handler in request.upload_handlers:
+        if isinstance(handler, ResumeUploadHandler):
+            return handler
+    return None
+
+
+def upload_error(request):
+    """Why the ``cv`` upload was rejected while streaming, or None."""
+    handler = _handler(request)
+    return handler.error if handler else None
+
+
+def upload_sha256(request, field_name='cv'):
+    """SHA-256 hex digest of an uploaded file, computed while it was received."""
+    handler = _handler(request)
+    return handler.digests.get(field_name) if handler else None
+
+
+class ResumeUploadMixin:
+    """Install :class:`ResumeUploadHandler` before the request body is parsed."""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        request.upload_handlers.insert(0, ResumeUploadHandler(request._request))
@@ -2,10 +2,16 @@ from django.urls import path
 from .views import (
     ContactCreateView,
     ContactListView,
+    ContactExportView,
     JobApplicationCreateView,
     JobApplicationListView,
+    JobApplicationResumeView,
+    JobApplicationExportView,
     PostListView,
     PostDetailView,
+    PostSearchView,
+    PostImageVariantView,
+    SiteBootstrapView,
     ResumeParseView,
     JobOpeningListView,
     JobOpeningAdminListView,
@@ -13,8 +19,11 @@ from .views import (
     ServiceListView,
     ServiceAdminListView,
     ServiceAdminDetailView,
+    ServiceBatchUpdateView,
     PostAdminListView,
     PostAdminDetailView,
+    PostBatchUpdateView,
+    MetricsView,
     UserAdminListView,
     UserAdminDetailView,
 )
@@ -23,15 +32,23 @@ urlpatterns = [
     # Contact endpoints
     path('contact/', ContactCreateView.as_view(), name='api-contact'),          # POST
     path('contacts/', ContactListView.as_view(), name='api-contacts'),         # GET list (admin)
+    path('contacts/export/<str:fmt>/', ContactExportView.as_view(), name='api-contacts-export'),  # GET csv|ndjson (admin)
 
     # Job application endpoints
     path('apply/', JobApplicationCreateView.as_view(), name='api-apply'),      # POST
     path('applications/', JobApplicationListView.as_view(), name='api-applications'),  # GET list (admin)
+    path('applications/export/<str:fmt>/', JobApplicationExportView.as_view(), name='api-applications-export'),  # GET csv|ndjson (admin)
+    path('applications/<int:pk>/cv/', JobApplicationResumeView.as_view(), name='api-application-cv'),  # GET file (admin or signed link)
     path('parse-resume/', ResumeParseView.as_view(), name='api-parse-resume'),  # POST
 
 
+    # Homepage bootstrap (public): services + jobs + latest posts in one request
+    path('bootstrap/', SiteBootstrapView.as_view(), name='api-bootstrap'),  # GET ?sections=&<section>.fields=&<section>.limit=
+
     # Blog/Post endpoints (public)
     path('posts/', PostListView.as_view(), name='api-posts'),
+    path('search/posts/', PostSearchView.as_view(), name='api-post-search'),  # GET ?q= (outside posts/, where it would shadow a post slugged "search")
+    path('posts/<int:pk>/image/<int:width>.<str:fmt>', PostImageVariantView.as_view(), name='api-post-image-variant'),  # GET ?v=
     path('posts/<slug:slug>/', PostDetailView.as_view(), name='api-post-detail'),
 
     # Job openings (public)
@@ -44,9 +61,12 @@ urlpatterns = [
     path('admin/jobs/', JobOpeningAdminListView.as_view(), name='api-admin-jobs'),
     path('admin/jobs/<int:pk>/', JobOpeningAdminDetailView.as_view(), name='api-admin-job-detail'),
     path('admin/services/', ServiceAdminListView.as_view(), name='api-admin-services'),
+    path('admin/services/batch/', ServiceBatchUpdateView.as_view(), name='api-admin-services-batch'),  # PATCH [{id, order, is_active}]
     path('admin/services/<int:pk>/', ServiceAdminDetailView.as_view(), name='api-admin-service-detail'),
     path('admin/posts/', PostAdminListView.as_view(), name='api-admin-posts'),
+    path('admin/posts/batch/', PostBatchUpdateView.as_view(), name='api-admin-posts-batch'),  # PATCH [{id, order, is_published}]
     path('admin/posts/<int:pk>/', PostAdminDetailView.as_view(), name='api-admin-post-detail'),
+    path('admin/metrics/', MetricsView.as_view(), name='api-admin-metrics'),  # GET Prometheus text
     path('admin/users/', UserAdminListView.as_view(), name='api-admin-users'),
     path('admin/users/<int:pk>/', UserAdminDetailView.as_view(), name='api-admin-user-detail'),
 ]
@@ -1,7 +1,4 @@
 import os
-import re
-import PyPDF2
-import io
 from rest_framework import generics
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
@@ -9,18 +6,43 @@ from rest_framework import status
 from rest_framework.views import APIView
 from django.contrib.auth.models import User
 from .models import ContactMessage, JobApplication, Post, JobOpening, Service
-from .serializers import ContactMessageSerializer, JobApplicationSerializer, PostSerializer, JobOpeningSerializer, ServiceSerializer, UserSerializer
+from .serializers import ContactMessageSerializer, JobApplicationSerializer, PostSerializer, PostSummarySerializer, JobOpeningSerializer, ServiceSerializer, UserSerializer, ServiceBatchItemSerializer, PostBatchItemSerializer
+from .cache import CachedListMixin, get_cache, versioned_key
+from .conditional import ConditionalGetMixin
+from .pagination import KeysetPagination
+from .mail import queue_email
+from .resume import ParserBusy, ParseTimeout, experience_years, get_cached_resume, parse_resume
+from .uploads import ResumeUploadMixin, upload_error, upload_sha256
+from .search import search_posts
+from .filters import filter_applications, filter_created
+from .exports import EXPORT_FORMATS, STREAMERS
+from .signals import content_changed
+from .throttling import TokenBucketThrottle
+from .metrics import render_prometheus
+from .images import FORMATS as IMAGE_FORMATS, generate_variants, get_widths, variant_name, variant_widths, version_token
+from PIL import Image
 from django.conf import settings
-from django.core.mail import EmailMessage
+from django.core import signing
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.http import urlencode
 from rest_framework.permissions import IsAdminUser
 
 
-class ResumeParseView(APIView):
+class ResumeParseView(ResumeUploadMixin, APIView):
     """Parse an uploaded PDF resume and return extracted fields."""
     parser_classes = [MultiPartParser, FormParser]
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = 'parse_resume'
 
     def post(self, request):
         cv = request.FILES.get('cv')
+        error = upload_error(request)
+        if error:
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
         if not cv:
             return Response({'error': 'No file uploaded.'}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -28,170 +50,81 @@ class ResumeParseView(APIView):
         if ext != '.pdf':
             return Response({'error': 'Only PDF files are supported.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        # The digest was computed while streaming; a cache hit skips reading the file.
+        digest = upload_sha256(request)
+        parsed = get_cached_resume(digest) if digest else None
         try:
-            reader = PyPDF2.PdfReader(io.BytesIO(cv.read()))
-            text = ''
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + '\n'
+            if parsed is None:
+                parsed = parse_resume(cv.read(), digest=digest)
+        except ParserBusy:
+            response = Response({'error': 'Resume parser is busy, please try again shortly.'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            response['Retry-After'] = str(getattr(settings, 'RESUME_PARSE_RETRY_AFTER', 5))
+            return response
+        except ParseTimeout:
+            return Response({'error': 'Failed to read PDF: it took too long to process.'}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({'error': f'Failed to read PDF: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
 
-        parsed = self._extract_fields(text)
-        return Response(parsed, status=status.HTTP_200_OK)
-
-    @staticmethod
-    def _extract_fields(text):
-        """Use regex to extract common resume fields from raw text."""
-        data = {
-            'name': '',
-            'email': '',
-            'phone': '',
-            'linkedin': '',
-            'qualification': '',
-            'experience': '',
-            'address': '',
-        }
-
-        # Email
-        email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
-        if email_match:
-            data['email'] = email_match.group()
-
-        # Phone (Indian & international formats)
-        phone_match = re.search(r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3,5}\)?[-.\s]?\d{3,4}[-.\s]?\d{3,4}', text)
-        if phone_match:
-            data['phone'] = phone_match.group().strip()
-
-        # LinkedIn
-        linkedin_match = re.search(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[a-zA-Z0-9_-]+/?', text, re.IGNORECASE)
-        if linkedin_match:
-            url = linkedin_match.group()
-            if not url.startswith('http'):
-                url = 'https://' + url
-            data['linkedin'] = url
-
-        # Name — first non-empty line that is not an email/phone/url
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        for line in lines[:5]:  # check first 5 lines
-            if '@' in line or re.search(r'\d{5,}', line) or 'linkedin' in line.lower() or 'http' in line.lower():
-                continue
-            # likely the name if it's short and mostly alphabetical
-            if len(line) < 60 and re.match(r'^[A-Za-z\s.\'-]+$', line):
-                data['name'] = line.strip()
-                break
-
-        # Address — look for lines with PIN/ZIP codes or address keywords
-        address_patterns = [
-            # Line containing a 6-digit Indian PIN code
-            r'.*\b\d{6}\b.*',
-            # Line containing a 5-digit US ZIP code
-            r'.*\b\d{5}(?:-\d{4})?\b.*',
-        ]
-        address_keywords = ['address', 'city', 'state', 'district', 'nagar', 'colony',
-                            'street', 'road', 'lane', 'sector', 'block', 'plot',
-                            'apartment', 'flat', 'floor', 'tower', 'phase',
-                            'delhi', 'mumbai', 'bangalore', 'hyderabad', 'chennai',
-                            'kolkata', 'pune', 'noida', 'gurgaon', 'gurugram',
-                            'india', 'maharashtra', 'karnataka', 'tamil nadu',
-                            'uttar pradesh', 'haryana', 'rajasthan', 'kerala']
-
-        for line in lines:
-            line_lower = line.lower()
-            # Skip lines that are clearly not addresses
-            if '@' in line or 'linkedin' in line_lower or 'http' in line_lower:
-                continue
-            # Check for PIN/ZIP code patterns
-            for pat in address_patterns:
-                if re.match(pat, line):
-                    data['address'] = line.strip()[:300]
-                    break
-            if data['address']:
-                break
-            # Check for address keywords
-            if any(kw in line_lower for kw in address_keywords):
-                data['address'] = line.strip()[:300]
-                break
-
-        # Experience
-        exp_patterns = [
-            r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)?',
-            r'(?:experience|exp)[\s:]*(\d+)\+?\s*(?:years?|yrs?)',
-        ]
-        for pat in exp_patterns:
-            exp_match = re.search(pat, text, re.IGNORECASE)
-            if exp_match:
-                years = exp_match.group(1)
-                data['experience'] = f'{years} years'
-                break
-
-        return data
+        return Response(parsed['fields'], status=status.HTTP_200_OK)
 
 
 ALLOWED_RESUME_EXTENSIONS = ['.pdf']
+RESUME_DOWNLOAD_SALT = 'api.resume-download'
 
 
-def send_email(subject, html_body, attachments=None):
-    """Send email via Django's SMTP backend to all configured receivers."""
-    recipients = getattr(settings, 'EMAIL_RECEIVERS', [])
-    if not recipients:
-        print("[Email] No EMAIL_RECEIVERS configured in .env")
-        return False
-
-    try:
-        email = EmailMessage(
-            subject=subject,
-            body=html_body,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=recipients,
-        )
-        email.content_subtype = 'html'  # send as HTML
+def resume_download_token(application_id):
+    """Signed, timestamped token for the CV download link in notification emails."""
+    return signing.dumps(application_id, salt=RESUME_DOWNLOAD_SALT)
 
-        if attachments:
-            for att in attachments:
-                email.attach(att['filename'], att['content'], att.get('type', 'application/octet-stream'))
 
-        email.send(fail_silently=False)
-        print(f"[Email] Sent to {recipients}")
-        return True
-    except Exception as e:
-        print(f"[Email] Error: {e}")
+def check_resume_download_token(token, application_id):
+    max_age = getattr(settings, 'RESUME_LINK_MAX_AGE', 7 * 24 * 60 * 60)
+    try:
+        return signing.loads(token, salt=RESUME_DOWNLOAD_SALT, max_age=max_age) == application_id
+    except signing.BadSignature:  # includes SignatureExpired
         return False
 
 
 class ContactCreateView(generics.CreateAPIView):
     queryset = ContactMessage.objects.all()
     serializer_class = ContactMessageSerializer
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = 'contact'
 
+    @transaction.atomic
     def perform_create(self, serializer):
+        # The message and its outbox row are saved together, so a stored
+        # message always has a notification queued.
         instance = serializer.save()
-        try:
-            html = f"""
-            <h2>New Contact Form Submission</h2>
-            <table style="border-collapse:collapse; width:100%;">
-                <tr><td style="padding:8px; font-weight:bold;">Name:</td><td style="padding:8px;">{instance.name}</td></tr>
-                <tr><td style="padding:8px; font-weight:bold;">Email:</td><td style="padding:8px;">{instance.email}</td></tr>
-            </table>
-            <h3>Message</h3>
-            <p>{instance.message}</p>
-            """
-            send_email(
-                subject=f"[Giggs] New contact from {instance.name}",
-                html_body=html,
-            )
-        except Exception:
-            pass
-
-
-class JobApplicationCreateView(generics.CreateAPIView):
+        html = f"""
+        <h2>New Contact Form Submission</h2>
+        <table style="border-collapse:collapse; width:100%;">
+            <tr><td style="padding:8px; font-weight:bold;">Name:</td><td style="padding:8px;">{instance.name}</td></tr>
+            <tr><td style="padding:8px; font-weight:bold;">Email:</td><td style="padding:8px;">{instance.email}</td></tr>
+        </table>
+        <h3>Message</h3>
+        <p>{instance.message}</p>
+        """
+        queue_email(
+            subject=f"[Giggs] New contact from {instance.name}",
+            html_body=html,
+        )
+
+
+class JobApplicationCreateView(ResumeUploadMixin, generics.CreateAPIView):
     queryset = JobApplication.objects.all()
     serializer_class = JobApplicationSerializer
     parser_classes = [MultiPartParser, FormParser]
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = 'apply'
 
     def create(self, request, *args, **kwargs):
-        # Validate resume file extension (PDF only)
+        # Size and PDF magic bytes were checked while the file streamed in
         cv_file = request.FILES.get('cv')
+        error = upload_error(request)
+        if error:
+            return Response({'cv': error}, status=status.HTTP_400_BAD_REQUEST)
+        # Validate resume file extension (PDF only)
         if cv_file:
             ext = os.path.splitext(cv_file.name)[1].lower()
             if ext not in ALLOWED_RESUME_EXTENSIONS:
@@ -201,77 +134,287 @@ class JobApplicationCreateView(generics.CreateAPIView):
                 )
         return super().create(request, *args, **kwargs)
 
+    @transaction.atomic
     def perform_create(self, serializer):
-        instance = serializer.save()
-        # Send email with resume attachment via Gmail SMTP
-        try:
-            html = f"""
-            <h2>📋 New Job Application</h2>
-            <table style="border-collapse:collapse; width:100%; font-size:14px;">
-                <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Position:</td><td style="padding:10px;">{instance.job_title}</td></tr>
-                <tr><td style="padding:10px; font-weight:bold;">Name:</td><td style="padding:10px;">{instance.name}</td></tr>
-                <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Email:</td><td style="padding:10px;">{instance.email}</td></tr>
-                <tr><td style="padding:10px; font-weight:bold;">Phone:</td><td style="padding:10px;">{instance.phone}</td></tr>
-                <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Age:</td><td style="padding:10px;">{instance.age or 'N/A'}</td></tr>
-                <tr><td style="padding:10px; font-weight:bold;">Qualification:</td><td style="padding:10px;">{instance.qualification}</td></tr>
-                <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Experience:</td><td style="padding:10px;">{instance.experience}</td></tr>
-                <tr><td style="padding:10px; font-weight:bold;">Address:</td><td style="padding:10px;">{instance.address}</td></tr>
-                <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Current CTC:</td><td style="padding:10px;">{instance.current_ctc}</td></tr>
-                <tr><td style="padding:10px; font-weight:bold;">Expected CTC:</td><td style="padding:10px;">{instance.expected_ctc}</td></tr>
-                <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">LinkedIn:</td><td style="padding:10px;">{instance.linkedin or 'N/A'}</td></tr>
-                <tr><td style="padding:10px; font-weight:bold;">Portfolio:</td><td style="padding:10px;">{instance.portfolio or 'N/A'}</td></tr>
-            </table>
-            <h3>Cover Letter / Message</h3>
-            <p>{instance.message or 'No message provided.'}</p>
-            <hr>
-            <p><em>Resume is attached to this email.</em></p>
-            """
-
-            attachments = []
-            if instance.cv:
-                instance.cv.seek(0)
+        # Numeric experience for filtering: from the form, else from the parse
+        # of this same file if the candidate ran it through parse-resume/.
+        years = experience_years(serializer.validated_data.get('experience', ''))
+        digest = upload_sha256(self.request)
+        if years is None and digest:
+            parsed = get_cached_resume(digest)
+            if parsed:
+                years = experience_years(parsed['fields']['experience'])
+        instance = serializer.save(experience_years=years)
+        # Queue the notification in the same transaction as the application.
+        # Small CVs are attached by the outbox worker straight from storage;
+        # large ones are linked instead.
+        attachments = []
+        resume_note = 'No resume was uploaded.'
+        if instance.cv:
+            url = self.request.build_absolute_uri(
+                reverse('api-application-cv', args=[instance.pk])
+            ) + '?' + urlencode({'token': resume_download_token(instance.pk)})
+            if instance.cv.size <= getattr(settings, 'RESUME_ATTACH_MAX_SIZE', 2 * 1024 * 1024):
                 attachments.append({
                     'filename': os.path.basename(instance.cv.name),
-                    'content': instance.cv.read(),
+                    'path': instance.cv.name,
                     'type': 'application/pdf',
+                    'url': url,  # sent instead if the outbox worker cannot read the file
                 })
+                resume_note = 'Resume is attached to this email.'
+            else:
+                days = getattr(settings, 'RESUME_LINK_MAX_AGE', 7 * 24 * 60 * 60) // (24 * 60 * 60)
+                resume_note = f'Resume is too large to attach: <a href="{url}">download it</a> (link valid for {days} days).'
+
+        html = f"""
+        <h2>📋 New Job Application</h2>
+        <table style="border-collapse:collapse; width:100%; font-size:14px;">
+            <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Position:</td><td style="padding:10px;">{instance.job_title}</td></tr>
+            <tr><td style="padding:10px; font-weight:bold;">Name:</td><td style="padding:10px;">{instance.name}</td></tr>
+            <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Email:</td><td style="padding:10px;">{instance.email}</td></tr>
+            <tr><td style="padding:10px; font-weight:bold;">Phone:</td><td style="padding:10px;">{instance.phone}</td></tr>
+            <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Age:</td><td style="padding:10px;">{instance.age or 'N/A'}</td></tr>
+            <tr><td style="padding:10px; font-weight:bold;">Qualification:</td><td style="padding:10px;">{instance.qualification}</td></tr>
+            <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Experience:</td><td style="padding:10px;">{instance.experience}</td></tr>
+            <tr><td style="padding:10px; font-weight:bold;">Address:</td><td style="padding:10px;">{instance.address}</td></tr>
+            <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">Current CTC:</td><td style="padding:10px;">{instance.current_ctc}</td></tr>
+            <tr><td style="padding:10px; font-weight:bold;">Expected CTC:</td><td style="padding:10px;">{instance.expected_ctc}</td></tr>
+            <tr style="background:#f8f9fa;"><td style="padding:10px; font-weight:bold;">LinkedIn:</td><td style="padding:10px;">{instance.linkedin or 'N/A'}</td></tr>
+            <tr><td style="padding:10px; font-weight:bold;">Portfolio:</td><td style="padding:10px;">{instance.portfolio or 'N/A'}</td></tr>
+        </table>
+        <h3>Cover Letter / Message</h3>
+        <p>{instance.message or 'No message provided.'}</p>
+        <hr>
+        <p><em>{resume_note}</em></p>
+        """
+
+        queue_email(
+            subject=f"[Giggs Careers] Application: {instance.name} — {instance.job_title}",
+            html_body=html,
+            attachments=attachments if attachments else None,
+        )
 
-            send_email(
-                subject=f"[Giggs Careers] Application: {instance.name} — {instance.job_title}",
-                html_body=html,
-                attachments=attachments if attachments else None,
-            )
-        except Exception as e:
-            print(f"[Career Email] Error: {e}")
 
+class PostListView(ConditionalGetMixin, CachedListMixin, generics.ListAPIView):
+    queryset = Post.objects.filter(is_published=True).only(*PostSummarySerializer.only_fields())
+    serializer_class = PostSummarySerializer
+    cache_models = (Post,)
 
-class PostListView(generics.ListAPIView):
-    queryset = Post.objects.filter(is_published=True)
-    serializer_class = PostSerializer
+class PostSearchView(APIView):
+    """Public: full-text search over published posts, best match first."""
+    max_limit = 50
 
-class PostDetailView(generics.RetrieveAPIView):
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()[:200]
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), self.max_limit)
+        except ValueError:
+            limit = 20
+        if not query:
+            return Response([])
+
+        cache = get_cache()
+        key = versioned_key((Post,), 'search', request.build_absolute_uri(), query, limit)
+        data = cache.get(key)
+        if data is None:
+            hits = search_posts(query, limit)
+            posts = Post.objects.only(*PostSummarySerializer.only_fields()).in_bulk([pk for pk, _, _ in hits])
+            data = []
+            for pk, rank, snippet in hits:
+                if pk in posts:
+                    item = PostSummarySerializer(posts[pk], context={'request': request}).data
+                    item['snippet'] = snippet
+                    item['rank'] = rank
+                    data.append(item)
+            cache.set(key, data, getattr(settings, 'API_CACHE_TIMEOUT', 300))
+        return Response(data)
+
+class SiteBootstrapView(APIView):
+    """
+    Public: services, active jobs and the latest posts in one response.
+
+    Query params (all optional):
+      sections=services,jobs,posts
+      <section>.fields=id,title,...   (subset of that section's serializer fields)
+      <section>.limit=N               (capped at the section's max)
+
+    One query per requested section, and none at all once cached.
+    """
+    sections = {
+        # name: (queryset, serializer, default limit, max limit)
+        'services': (Service.objects.filter(is_active=True), ServiceSerializer, 50, 50),
+        'jobs': (JobOpening.objects.filter(is_active=True), JobOpeningSerializer, 20, 50),
+        'posts': (Post.objects.filter(is_published=True), PostSummarySerializer, 6, 24),
+    }
+
+    def get(self, request):
+        params = request.query_params
+        names = [n.strip() for n in params.get('sections', ','.join(self.sections)).split(',') if n.strip()]
+        unknown = [n for n in names if n not in self.sections]
+        if unknown:
+            return Response({'error': f"Unknown sections: {', '.join(unknown)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        plan = {}
+        for name in names:
+            queryset, serializer_class, default_limit, max_limit = self.sections[name]
+            allowed = serializer_class.Meta.fields
+            fields = params.get(f'{name}.fields')
+            if fields:
+                fields = [f.strip() for f in fields.split(',') if f.strip()]
+                bad = [f for f in fields if f not in allowed]
+                if bad:
+                    return Response(
+                        {'error': f"Unknown {name} fields: {', '.join(bad)}", 'allowed': allowed},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+            else:
+                fields = list(allowed)
+            try:
+                limit = min(max(int(params.get(f'{name}.limit', default_limit)), 0), max_limit)
+            except ValueError:
+                limit = default_limit
+            plan[name] = (queryset, serializer_class, fields, limit)
+
+        cache = get_cache()
+        key = versioned_key((Service, JobOpening, Post), 'bootstrap', request.build_absolute_uri())
+        data = cache.get(key)
+        if data is None:
+            data = {}
+            for name, (queryset, serializer_class, fields, limit) in plan.items():
+                rows = queryset.only(*serializer_class.only_fields(fields))[:limit] if limit else []
+                data[name] = serializer_class(rows, many=True, fields=fields, context={'request': request}).data
+            cache.set(key, data, getattr(settings, 'API_CACHE_TIMEOUT', 300))
+        return Response(data)
+
+class PostDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Post.objects.filter(is_published=True)
     serializer_class = PostSerializer
     lookup_field = 'slug'
 
 
+class PostImageVariantView(APIView):
+    """Public: a resized WebP/JPEG of a post image, generated on first request."""
+
+    def get(self, request, pk, width, fmt):
+        if fmt not in IMAGE_FORMATS or width not in get_widths():
+            raise Http404
+        post = get_object_or_404(Post.objects.filter(is_published=True).only('id', 'image', 'image_width'), pk=pk)
+        if not post.image:
+            raise Http404
+        name = variant_name(post.image.name, width, fmt)
+        storage = post.image.storage
+        if not storage.exists(name):
+            try:
+                original_width = generate_variants(post.image, original_width=post.image_width)
+            except (OSError, ValueError, Image.DecompressionBombError) as e:
+                print(f"[Images] Could not resize {post.image.name}: {e}")
+                raise Http404
+            if original_width != post.image_width:
+                post.image_width = original_width
+                post.updated_at = timezone.now()  # the srcsets change with it, so does the ETag
+                post.save(update_fields=['image_width', 'updated_at'])
+            if width not in dict(variant_widths(original_width)):
+                raise Http404  # wider than the original; the srcset never links it
+        response = FileResponse(storage.open(name, 'rb'), content_type=IMAGE_FORMATS[fmt][1])
+        if request.query_params.get('v') == version_token(post.image.name):
+            response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response['Cache-Control'] = 'public, max-age=3600'
+        return response
+
+
+class JobApplicationResumeView(APIView):
+    """Admin: stream an applicant's CV. Accepts an admin JWT or the signed link from the email."""
+
+    def get(self, request, pk):
+        if not (request.user and request.user.is_staff):
+            token = request.query_params.get('token', '')
+            if not check_resume_download_token(token, pk):
+                return Response({'error': 'Invalid or expired link.'}, status=status.HTTP_403_FORBIDDEN)
+        application = get_object_or_404(JobApplication, pk=pk)
+        if not application.cv:
+            raise Http404
+        return FileResponse(
+            application.cv.open('rb'),
+            as_attachment=True,
+            filename=os.path.basename(application.cv.name),
+            content_type='application/pdf',
+        )
+
+
 class ContactListView(generics.ListAPIView):
-    queryset = ContactMessage.objects.all().order_by('-created_at')
+    """Admin: contact messages, newest first. Filters: created_after / created_before."""
+    queryset = ContactMessage.objects.all().order_by('-created_at', '-id')
     serializer_class = ContactMessageSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        return filter_created(super().get_queryset(), self.request.query_params)
 
 class JobApplicationListView(generics.ListAPIView):
-    queryset = JobApplication.objects.all().order_by('-created_at')
+    """Admin: applications, newest first. Filters: see api/filters.py."""
+    queryset = JobApplication.objects.all().order_by('-created_at', '-id')
     serializer_class = JobApplicationSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        return filter_applications(super().get_queryset(), self.request.query_params)
+
+
+# ─── Admin exports (CSV / NDJSON, streamed) ───
+
+class ExportView(APIView):
+    """Base for streaming exports; takes the same filters as the matching list view."""
+    permission_classes = [IsAdminUser]
+    queryset = None
+    fields = ()
+    filename = 'export'
+
+    def filter_queryset(self, queryset):
+        return queryset
+
+    def get(self, request, fmt):
+        if fmt not in STREAMERS:
+            raise Http404
+        queryset = self.filter_queryset(self.queryset.all())
+        response = StreamingHttpResponse(STREAMERS[fmt](queryset, list(self.fields)), content_type=EXPORT_FORMATS[fmt])
+        stamp = timezone.now().strftime('%Y%m%d-%H%M%S')
+        response['Content-Disposition'] = f'attachment; filename="{self.filename}-{stamp}.{fmt}"'
+        response['Cache-Control'] = 'no-store'
+        return response
+
+class JobApplicationExportView(ExportView):
+    """Admin: export applications. Filters: see api/filters.py."""
+    queryset = JobApplication.objects.order_by('-created_at', '-id')
+    fields = (
+        'id', 'created_at', 'job_title', 'name', 'email', 'phone', 'age',
+        'qualification', 'experience', 'experience_years', 'address',
+        'current_ctc', 'expected_ctc', 'linkedin', 'portfolio', 'message', 'cv',
+    )
+    filename = 'applications'
+
+    def filter_queryset(self, queryset):
+        return filter_applications(queryset, self.request.query_params)
+
+class ContactExportView(ExportView):
+    """Admin: export contact messages. Filters: created_after / created_before."""
+    queryset = ContactMessage.objects.order_by('-created_at', '-id')
+    fields = ('id', 'created_at', 'name', 'email', 'message')
+    filename = 'contacts'
+
+    def filter_queryset(self, queryset):
+        return filter_created(queryset, self.request.query_params)
 
 
 # ─── Admin CRUD for Job Openings ───
 
-class JobOpeningListView(generics.ListAPIView):
+class JobOpeningListView(ConditionalGetMixin, CachedListMixin, generics.ListAPIView):
     """Public: list active job openings."""
     queryset = JobOpening.objects.filter(is_active=True)
     serializer_class = JobOpeningSerializer
+    cache_models = (JobOpening,)
 
 class JobOpeningAdminListView(generics.ListCreateAPIView):
     """Admin: list ALL job openings (inc. inactive) + create new."""
@@ -286,12 +429,56 @@ class JobOpeningAdminDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAdminUser]
 
 
+# ─── Admin batch edits (drag-and-drop reorder, bulk publish) ───
+
+class BatchUpdateView(APIView):
+    """
+    Base for ``PATCH [{id, order, ...}, ...]``: one transaction, one
+    ``bulk_update`` and one cache invalidation for the whole list.
+    """
+    permission_classes = [IsAdminUser]
+    model = None
+    item_serializer_class = None
+
+    def patch(self, request):
+        serializer = self.item_serializer_class(data=request.data, many=True, allow_empty=False)
+        serializer.is_valid(raise_exception=True)
+        changes = {item.pop('id'): item for item in serializer.validated_data}
+        if len(changes) != len(serializer.validated_data):
+            return Response({'error': 'Each id may appear only once.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        editable = [name for name in self.item_serializer_class().fields if name != 'id']
+        with transaction.atomic():
+            rows = self.model.objects.select_for_update().only('id', *editable).in_bulk(changes)
+            missing = sorted(set(changes) - set(rows))
+            if missing:
+                return Response({'error': 'Unknown ids.', 'ids': missing}, status=status.HTTP_404_NOT_FOUND)
+
+            now = timezone.now()
+            changed, fields = [], set()
+            for pk, values in changes.items():
+                row = rows[pk]
+                diff = {name: value for name, value in values.items() if getattr(row, name) != value}
+                if diff:
+                    for name, value in diff.items():
+                        setattr(row, name, value)
+                    row.updated_at = now  # bulk_update skips auto_now, and ETags key on updated_at
+                    changed.append(row)
+                    fields.update(diff)
+            if changed:
+                self.model.objects.bulk_update(changed, [*sorted(fields), 'updated_at'])
+                transaction.on_commit(lambda: content_changed(self.model))  # bulk_update sends no post_save
+
+        return Response({'updated': len(changed), 'ids': sorted(row.pk for row in changed)})
+
+
 # ─── Admin CRUD for Services ───
 
-class ServiceListView(generics.ListAPIView):
+class ServiceListView(ConditionalGetMixin, CachedListMixin, generics.ListAPIView):
     """Public: list active services."""
     queryset = Service.objects.filter(is_active=True)
     serializer_class = ServiceSerializer
+    cache_models = (Service,)
 
 class ServiceAdminListView(generics.ListCreateAPIView):
     """Admin: list ALL services + create new."""
@@ -305,9 +492,24 @@ class ServiceAdminDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = ServiceSerializer
     permission_classes = [IsAdminUser]
 
+class ServiceBatchUpdateView(BatchUpdateView):
+    """Admin: reorder / (de)activate many services in one request."""
+    model = Service
+    item_serializer_class = ServiceBatchItemSerializer
+
 
 # ─── Admin CRUD for Posts ───
 
+def make_image_variants(post):
+    """Resize a freshly uploaded post image; a bad image never fails the save."""
+    try:
+        post.image_width = generate_variants(post.image, only_missing=False)
+    except Exception as e:
+        post.image_width = None
+        print(f"[Images] Could not resize {post.image.name}: {e}")
+    post.updated_at = timezone.now()
+    post.save(update_fields=['image_width', 'updated_at'])
+
 class PostAdminListView(generics.ListCreateAPIView):
     """Admin: list ALL posts (inc. unpublished) + create new."""
     queryset = Post.objects.all()
@@ -315,6 +517,22 @@ class PostAdminListView(generics.ListCreateAPIView):
     permission_classes = [IsAdminUser]
     parser_classes = [MultiPartParser, FormParser]
 
+    def get_queryset(self):
+        if self.request.method == 'GET':
+            return self.queryset.only(*PostSummarySerializer.only_fields())
+        return super().get_queryset()
+
+    def get_serializer_class(self):
+        # Lists carry card fields only; creating a post still takes the full body.
+        if self.request.method == 'GET':
+            return PostSummarySerializer
+        return super().get_serializer_class()
+
+    def perform_create(self, serializer):
+        post = serializer.save()
+        if 'image' in self.request.FILES:
+            make_image_variants(post)
+
 class PostAdminDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Admin: retrieve / update / delete a single post."""
     queryset = Post.objects.all()
@@ -322,6 +540,26 @@ class PostAdminDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAdminUser]
     parser_classes = [MultiPartParser, FormParser]
 
+    def perform_update(self, serializer):
+        post = serializer.save()
+        if 'image' in self.request.FILES:
+            make_image_variants(post)
+
+class PostBatchUpdateView(BatchUpdateView):
+    """Admin: reorder / (un)publish many posts in one request."""
+    model = Post
+    item_serializer_class = PostBatchItemSerializer
+
+
+# ─── Admin metrics ───
+
+class MetricsView(APIView):
+    """Admin: request and DB metrics of all workers, in Prometheus text format (see api/metrics.py)."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 
 # ─── Admin User Management ───
 
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import dj_database_url
 from pathlib import Path
 from dotenv import load_dotenv
@@ -34,6 +35,9 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # must be high
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'api.snapshots.SnapshotMiddleware',  # static JSON snapshots of the public API
+    'api.metrics.MetricsMiddleware',  # per-view latency / DB metrics, see api/admin/metrics/
+    'api.timing.ServerTimingMiddleware',  # Server-Timing header (SERVER_TIMING)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -70,6 +74,34 @@ DATABASES = {
     )
 }
 
+# Cache — backs the public response cache (api/cache.py).
+# CACHE_URL: locmem:// (default, per process), file:///path/to/dir or redis://host:6379/0.
+# Use file or redis in production: version bumps from admin edits, management
+# commands and other gunicorn workers only reach a worker through a shared cache
+# (manage.py check / migrate warn about locmem when DEBUG is off).
+CACHE_URL = os.getenv('CACHE_URL', 'locmem://')
+CACHE_IS_SHARED = CACHE_URL.startswith(('redis://', 'rediss://', 'file://'))
+if CACHE_URL.startswith(('redis://', 'rediss://')):
+    _default_cache = {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': CACHE_URL}
+elif CACHE_URL.startswith('file://'):
+    _default_cache = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': CACHE_URL[len('file://'):]}
+else:
+    _default_cache = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'giggs-default'}
+CACHES = {
+    'default': _default_cache,
+    # Parsed resumes keyed by file SHA-256 (api/resume.py); LRU, per process.
+    'resumes': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'giggs-resumes',
+        'TIMEOUT': int(os.getenv('RESUME_CACHE_TIMEOUT', 60 * 60 * 24)),
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('RESUME_CACHE_MAX_ENTRIES', 500)), 'CULL_FREQUENCY': 10},
+    },
+}
+
+API_CACHE_ALIAS = 'default'
+# seconds; a per-process cache cannot see other processes' bumps, so it only bridges short bursts
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', 60 * 60 * 24 if CACHE_IS_SHARED else 60))
+
 # Password validation (default)
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -90,6 +122,16 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Widths of the WebP/JPEG variants generated for Post.image (api/images.py)
+IMAGE_VARIANT_WIDTHS = (320, 640, 1024, 1600)
+
+# Static JSON snapshots of the public API (api/snapshots.py, manage.py publish_snapshots)
+SNAPSHOT_URL = '/snapshots/'
+SNAPSHOT_ROOT = Path(os.getenv('SNAPSHOT_ROOT', BASE_DIR / 'snapshots'))
+SNAPSHOT_BASE_URL = os.getenv('SNAPSHOT_BASE_URL', '')  # e.g. https://api.example.com, for absolute image URLs
+SNAPSHOT_PUBLISH_ON_SAVE = os.getenv('SNAPSHOT_PUBLISH_ON_SAVE', 'False') == 'True'
+SNAPSHOT_RETENTION = 60 * 60 * 24  # seconds superseded snapshot files are kept
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST framework basic settings
@@ -100,8 +142,52 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.timing.TimedJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    # Token buckets for the anonymous POST endpoints (api/throttling.py): "<burst>/<period>",
+    # per client IP and, with the _global suffix, shared by all clients.
+    'DEFAULT_THROTTLE_RATES': {
+        'parse_resume': os.getenv('THROTTLE_PARSE_RESUME', '10/hour'),
+        'parse_resume_global': os.getenv('THROTTLE_PARSE_RESUME_GLOBAL', '120/hour'),
+        'contact': os.getenv('THROTTLE_CONTACT', '5/hour'),
+        'contact_global': os.getenv('THROTTLE_CONTACT_GLOBAL', '100/hour'),
+        'apply': os.getenv('THROTTLE_APPLY', '5/hour'),
+        'apply_global': os.getenv('THROTTLE_APPLY_GLOBAL', '200/hour'),
+    },
+    # Proxies in front of gunicorn, so the client IP is read from X-Forwarded-For correctly.
+    'NUM_PROXIES': int(os.environ['NUM_PROXIES']) if os.getenv('NUM_PROXIES') else None,
 }
 
+# Request metrics (api/metrics.py): every worker writes its counters to METRICS_DIR/<pid>-<start ms>.json
+METRICS_DIR = os.getenv('METRICS_DIR', '')  # default: <tmp>/giggs-metrics
+METRICS_FLUSH_INTERVAL = 5  # seconds
+
+# Server-Timing header with per-phase durations (api/timing.py), on a sampled share of requests
+SERVER_TIMING = os.getenv('SERVER_TIMING', str(DEBUG)) == 'True'
+SERVER_TIMING_SAMPLE_RATE = float(os.getenv('SERVER_TIMING_SAMPLE_RATE', 1.0))  # 0.0 - 1.0
+SERVER_TIMING_ALLOW_ORIGIN = os.getenv('SERVER_TIMING_ALLOW_ORIGIN', '')  # Timing-Allow-Origin, for a cross-origin frontend
+
+# Cache holding the throttle buckets (api/throttling.py). It must be shared by every worker, or each
+# one enforces its own limits: the default cache when CACHE_URL is shared, else a file cache that the
+# workers of one host share (use redis:// once there is more than one instance).
+if CACHE_IS_SHARED:
+    THROTTLE_CACHE_ALIAS = 'default'
+else:
+    CACHES['throttle'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('THROTTLE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'giggs-throttle')),
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    }
+    THROTTLE_CACHE_ALIAS = 'throttle'
+
+# Page size for the cursor-paginated admin lists (?page_size= overrides, max 500)
+ADMIN_PAGE_SIZE = int(os.getenv('ADMIN_PAGE_SIZE', 50))
+
+# Rows fetched per round trip by the streaming admin exports (api/exports.py)
+EXPORT_CHUNK_SIZE = 2000
+
 # CORS
 if DEBUG:
     CORS_ALLOW_ALL_ORIGINS = True          # any origin OK while developing
@@ -122,3 +208,17 @@ EMAIL_RECEIVERS = [
     e.strip() for e in os.getenv('EMAIL_RECEIVERS', '').split(',') if e.strip()
 ]
 
+# Email outbox (api/mail.py) — drained by `python manage.py send_outbox --loop`
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', 8))
+EMAIL_OUTBOX_BACKOFF = int(os.getenv('EMAIL_OUTBOX_BACKOFF', 30))  # seconds, doubled per attempt
+EMAIL_OUTBOX_BACKOFF_MAX = int(os.getenv('EMAIL_OUTBOX_BACKOFF_MAX', 60 * 60))
+
+# Resume parsing (api/resume.py) — runs in a bounded process pool
+RESUME_PARSE_WORKERS = int(os.getenv('RESUME_PARSE_WORKERS', 2))  # also the in-flight jobs per web worker before 503
+RESUME_PARSE_MAX_PAGES = int(os.getenv('RESUME_PARSE_MAX_PAGES', 3))
+RESUME_PARSE_TIMEOUT = float(os.getenv('RESUME_PARSE_TIMEOUT', 10))  # seconds
+RESUME_PARSE_RETRY_AFTER = 5  # seconds, sent with 503 when every parser is busy
+RESUME_CACHE_ALIAS = 'resumes'
+RESUME_ATTACH_MAX_SIZE = int(os.getenv('RESUME_ATTACH_MAX_SIZE', 2 * 1024 * 1024))  # larger CVs are emailed as a signed link
+RESUME_LINK_MAX_AGE = 7 * 24 * 60 * 60  # seconds the emailed CV link stays valid
+RESUME_MAX_UPLOAD_SIZE = int(os.getenv('RESUME_MAX_UPLOAD_SIZE', 5 * 1024 * 1024))  # bytes, enforced while streaming (api/uploads.py)
@@ -1,68 +1,243 @@
-import sqlite3
+"""
+Export the Django SQLite database as MySQL import scripts for Hostinger.
+
+backend/migrate_to_mysql.py
+
+Each table is streamed with ``fetchmany`` into its own file as multi-row
+``INSERT`` statements, wrapped in a single transaction with keys and
+constraint checks disabled. Tables are exported in parallel, and a
+checkpoint per table lets an interrupted export pick up where it stopped
+(``--resume``). When every table is done the files are concatenated into
+``hostinger_import.sql`` as before.
+
+    python migrate_to_mysql.py [--batch-size 500] [--workers 4] [--resume]
+"""
+import argparse
+import json
 import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-# backend/migrate_to_mysql.py
+# Map Django tables to our MySQL names (also used by `manage.py import_sqlite_data`)
+TABLE_MAP = {
+    'api_post': 'posts',
+    'api_service': 'services',
+    'api_jobopening': 'job_openings',
+    'api_contactmessage': 'contact_messages',
+    'api_jobapplication': 'job_applications',
+}
+
+HEADER = (
+    "-- Giggs Labs Data Migration Script\n"
+    "SET NAMES utf8mb4;\n"
+    "SET SQL_MODE = 'NO_AUTO_VALUE_ON_ZERO';\n"
+    "SET time_zone = '+00:00';\n"
+)
+
+# MySQL string literal escapes; the backslash must be handled first.
+_ESCAPES = {'\\': '\\\\', '\0': '\\0', '\n': '\\n', '\r': '\\r', '\x1a': '\\Z', "'": "\\'", '"': '\\"'}
+_ESCAPE_RE = re.compile('|'.join(re.escape(c) for c in _ESCAPES))
+
+
+def sql_literal(value, is_bool=False):
+    """Render one SQLite value as a MySQL literal."""
+    if value is None:
+        return 'NULL'
+    if is_bool or isinstance(value, bool):
+        return '1' if value and value not in ('0', 'False', 'false') else '0'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        return f"X'{data.hex()}'" if data else "''"
+    return "'" + _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group()], str(value)) + "'"
+
+
+def load_schema_columns(schema_path):
+    """``{mysql_table: {column, ...}}`` from the CREATE TABLE statements of a schema file."""
+    if not schema_path or not os.path.exists(schema_path):
+        return {}
+    with open(schema_path, encoding='utf-8') as f:
+        schema = f.read()
+    tables = {}
+    for name, body in re.findall(r'CREATE TABLE (?:IF NOT EXISTS )?`(\w+)` \((.*?)\n\)', schema, re.S):
+        tables[name] = set(re.findall(r'^\s*`(\w+)`', body, re.M))
+    return tables
+
+
+# ─── Checkpoints ───
+
+def _checkpoint_path(out_dir, mysql_table):
+    return os.path.join(out_dir, f'{mysql_table}.checkpoint.json')
+
+
+def _read_checkpoint(out_dir, mysql_table):
+    try:
+        with open(_checkpoint_path(out_dir, mysql_table), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_checkpoint(out_dir, mysql_table, state):
+    path = _checkpoint_path(out_dir, mysql_table)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(path + '.tmp', path)  # atomic, so a crash never leaves half a checkpoint
 
-def export_to_sql():
-    db_path = 'db.sqlite3'
-    if not os.path.exists(db_path):
-        print(f"Error: {db_path} not found.")
-        return
+
+# ─── Export ───
+
+def export_table(db_path, out_dir, django_table, mysql_table, batch_size,
+                 max_statement_bytes, resume, schema_columns=None):
+    """Export one table to ``<out_dir>/<mysql_table>.sql``; return the row count."""
+    sql_path = os.path.join(out_dir, f'{mysql_table}.sql')
+    state = _read_checkpoint(out_dir, mysql_table) if resume and os.path.exists(sql_path) else None
+    if state and state.get('done'):
+        print(f"[{mysql_table}] already exported ({state['rows']} rows), skipping")
+        return state['rows']
 
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    sql_file = 'hostinger_import.sql'
-    with open(sql_file, 'w', encoding='utf-8') as f:
-        f.write("-- Giggs Labs Data Migration Script\n")
-        f.write("SET SQL_MODE = 'NO_AUTO_VALUE_ON_ZERO';\n")
-        f.write("SET time_zone = '+00:00';\n\n")
-
-        # Map Django tables to our new MySQL names
-        table_map = {
-            'api_post': 'posts',
-            'api_service': 'services',
-            'api_jobopening': 'job_openings',
-            'api_contactmessage': 'contact_messages',
-            'api_jobapplication': 'job_applications'
-        }
+    try:
+        cursor = conn.cursor()
+        info = cursor.execute(f'PRAGMA table_info("{django_table}")').fetchall()
+        if not info:
+            print(f"[{mysql_table}] {django_table} not found, skipping")
+            return 0
+        columns = [(col[1], 'bool' in (col[2] or '').lower()) for col in info]
+        if schema_columns:
+            skipped = [name for name, _ in columns if name not in schema_columns]
+            if skipped:
+                print(f"[{mysql_table}] not in target schema, skipped: {', '.join(skipped)}")
+            columns = [(name, is_bool) for name, is_bool in columns if name in schema_columns]
+        col_names = ', '.join(f'`{name}`' for name, _ in columns)
+        select = ', '.join(f'"{name}"' for name, _ in columns)
+        bool_flags = [is_bool for _, is_bool in columns]
 
-        for django_table, mysql_table in table_map.items():
-            f.write(f"-- Data for {mysql_table}\n")
-            try:
-                cursor.execute(f"SELECT * FROM {django_table}")
-                rows = cursor.fetchall()
+        # Binary mode so checkpoint offsets are real byte positions.
+        if state:
+            f = open(sql_path, 'r+b')
+            f.seek(state['offset'])
+            f.truncate()
+            print(f"[{mysql_table}] resuming after rowid {state['last_rowid']} ({state['rows']} rows done)")
+        else:
+            f = open(sql_path, 'wb')
+            f.write((
+                HEADER
+                + f"\n-- Data for {mysql_table}\n"
+                + "SET FOREIGN_KEY_CHECKS = 0;\nSET UNIQUE_CHECKS = 0;\nSET AUTOCOMMIT = 0;\n"
+                + f"/*!40000 ALTER TABLE `{mysql_table}` DISABLE KEYS */;\n"
+                + "START TRANSACTION;\n"
+            ).encode())
+            state = {'done': False, 'rows': 0, 'last_rowid': 0, 'offset': f.tell()}
+
+        with f:
+            cursor.execute(
+                f'SELECT rowid, {select} FROM "{django_table}" WHERE rowid > ? ORDER BY rowid',
+                (state['last_rowid'],),
+            )
+            prefix = f"INSERT INTO `{mysql_table}` ({col_names}) VALUES\n"
+            while True:
+                rows = cursor.fetchmany(batch_size)
                 if not rows:
-                    continue
-
-                # Get column names
-                cursor.execute(f"PRAGMA table_info({django_table})")
-                cols = [col[1] for col in cursor.fetchall()]
-                
-                # Filter for columns that exist in our new schema
-                # (Simple approach: we'll just write the INSERT statement)
-                col_names = ", ".join([f"`{c}`" for c in cols])
-                
+                    break
+                statement, size = [], len(prefix)
                 for row in rows:
-                    vals = []
-                    for val in row:
-                        if val is None:
-                            vals.append('NULL')
-                        elif isinstance(val, str):
-                            processed_val = val.replace("'", "''")
-                            vals.append(f"'{processed_val}'")
-                        elif isinstance(val, bool):
-                            vals.append('1' if val else '0')
-                        else:
-                            vals.append(str(val))
-                    
-                    f.write(f"INSERT INTO {mysql_table} ({col_names}) VALUES ({', '.join(vals)});\n")
-                f.write("\n")
+                    values = '(' + ', '.join(sql_literal(v, b) for v, b in zip(row[1:], bool_flags)) + ')'
+                    if statement and size + len(values) > max_statement_bytes:
+                        f.write((prefix + ',\n'.join(statement) + ';\n').encode())
+                        statement, size = [], len(prefix)
+                    statement.append(values)
+                    size += len(values) + 2
+                f.write((prefix + ',\n'.join(statement) + ';\n').encode())
+                f.flush()
+                state.update(rows=state['rows'] + len(rows), last_rowid=rows[-1][0], offset=f.tell())
+                _write_checkpoint(out_dir, mysql_table, state)
+
+            f.write((
+                "COMMIT;\n"
+                f"/*!40000 ALTER TABLE `{mysql_table}` ENABLE KEYS */;\n"
+                "SET UNIQUE_CHECKS = 1;\nSET FOREIGN_KEY_CHECKS = 1;\n"
+            ).encode())
+            state.update(done=True, offset=f.tell())
+            _write_checkpoint(out_dir, mysql_table, state)
+    finally:
+        conn.close()
+
+    print(f"[{mysql_table}] exported {state['rows']} rows")
+    return state['rows']
+
+
+def export_to_sql(db_path='db.sqlite3', out_dir='mysql_export', output='hostinger_import.sql',
+                  batch_size=500, max_statement_bytes=1024 * 1024, workers=None, resume=False,
+                  tables=None, schema_path='giggs_schema.sql'):
+    if not os.path.exists(db_path):
+        print(f"Error: {db_path} not found.")
+        return False
+
+    os.makedirs(out_dir, exist_ok=True)
+    selected = {t: m for t, m in TABLE_MAP.items() if not tables or t in tables or m in tables}
+    schema = load_schema_columns(schema_path)
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                export_table, db_path, out_dir, django_table, mysql_table, batch_size,
+                max_statement_bytes, resume, schema.get(mysql_table),
+            ): mysql_table
+            for django_table, mysql_table in selected.items()
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
             except Exception as e:
-                print(f"Skipping {django_table}: {e}")
+                failed.append(futures[future])
+                print(f"[{futures[future]}] failed: {e}")
+
+    if failed:
+        print(f"Export incomplete ({', '.join(failed)}); rerun with --resume to continue.")
+        return False
+
+    if output:
+        # Keep the single-file import the Hostinger console expects.
+        with open(output, 'wb') as out:
+            for mysql_table in selected.values():
+                path = os.path.join(out_dir, f'{mysql_table}.sql')
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        while chunk := f.read(1024 * 1024):
+                            out.write(chunk)
+                    out.write(b'\n')
+        print(f"Successfully generated {output}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export db.sqlite3 as MySQL import scripts.")
+    parser.add_argument('--db', default='db.sqlite3', help="SQLite database to read.")
+    parser.add_argument('--out-dir', default='mysql_export', help="Directory for per-table files and checkpoints.")
+    parser.add_argument('--output', default='hostinger_import.sql', help="Combined file ('' to skip).")
+    parser.add_argument('--batch-size', type=int, default=500, help="Rows fetched and inserted per statement.")
+    parser.add_argument('--max-statement-bytes', type=int, default=1024 * 1024,
+                        help="Split INSERTs above this size (keep under MySQL max_allowed_packet).")
+    parser.add_argument('--workers', type=int, default=None, help="Tables exported in parallel.")
+    parser.add_argument('--resume', action='store_true', help="Continue an interrupted export from its checkpoints.")
+    parser.add_argument('--tables', nargs='*', help="Only these tables (Django or MySQL names).")
+    parser.add_argument('--schema', default='giggs_schema.sql',
+                        help="Target schema; columns missing from it are not exported ('' for all columns).")
+    args = parser.parse_args()
+
+    ok = export_to_sql(
+        db_path=args.db, out_dir=args.out_dir, output=args.output, batch_size=args.batch_size,
+        max_statement_bytes=args.max_statement_bytes, workers=args.workers, resume=args.resume,
+        tables=args.tables, schema_path=args.schema,
+    )
+    raise SystemExit(0 if ok else 1)
 
-    print(f"Successfully generated {sql_file}")
-    conn.close()
 
 if __name__ == '__main__':
-    export_to_sql()
+    main()
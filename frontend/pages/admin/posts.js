@@ -95,7 +95,15 @@ export default function AdminPosts() {
         } catch { setError('Failed to update'); }
     }
 
-    function startEdit(post) {
+    async function startEdit(summary) {
+        // The list only carries card fields; load the full post (with content) to edit it.
+        setError('');
+        let post;
+        try {
+            const res = await apiFetch(`/admin/posts/${summary.id}/`);
+            if (!res.ok) { setError('Failed to load post'); return; }
+            post = await res.json();
+        } catch { setError('Failed to load post'); return; }
         setForm({
             title: post.title, slug: post.slug, category: post.category,
             excerpt: post.excerpt, content: post.content, 